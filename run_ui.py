@@ -4,6 +4,8 @@ Launcher script for Vibe-Code Auditor UI mode.
 This script launches the Streamlit web interface for non-technical users.
 """
 
+import importlib.util
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -25,17 +27,32 @@ def main():
     print("Press Ctrl+C to stop the server.")
     print("=" * 60 + "\n")
 
-    # Launch Streamlit
+    streamlit_command = [
+        sys.executable,
+        "-m",
+        "streamlit",
+        "run",
+        str(app_path),
+        "--server.headless=false",
+        "--browser.gatherUsageStats=false"
+    ]
+
+    # POSIX: replace the launcher process with Streamlit instead of keeping
+    # a parent interpreter alive; Streamlit receives Ctrl+C directly.
+    if os.name == 'posix':
+        if importlib.util.find_spec("streamlit") is None:
+            print("\n❌ Streamlit not found. Please install it:")
+            print("   pip install streamlit")
+            sys.exit(1)
+        try:
+            os.execvp(sys.executable, streamlit_command)
+        except OSError as e:
+            print(f"\n❌ Error launching UI: {e}")
+            sys.exit(1)
+
+    # Launch Streamlit as a child process (Windows has no real exec)
     try:
-        subprocess.run([
-            sys.executable,
-            "-m",
-            "streamlit",
-            "run",
-            str(app_path),
-            "--server.headless=false",
-            "--browser.gatherUsageStats=false"
-        ], check=True)
+        subprocess.run(streamlit_command, check=True)
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down UI server...")
         sys.exit(0)
@@ -1,12 +1,20 @@
 """AI-powered code analysis using Claude Code API."""
 
+import hashlib
+import heapq
+import json
+import os
 import re
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Set, Tuple
 import anthropic
 
-from src.config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL, ANALYSIS_MODES
+from src.config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL, ANALYSIS_MODES, MAX_CONCURRENT_REQUESTS
 from src.utils.logger import setup_logger
+from src.utils.cache_manager import CacheManager
 
 # Module logger
 logger = setup_logger(__name__)
@@ -14,32 +22,328 @@ logger = setup_logger(__name__)
 # Claude API 기본 타임아웃(초) - 테스트에서도 동일 상수를 사용해 검증
 DEFAULT_CLAUDE_TIMEOUT = 180.0
 
+# 파일 읽기는 I/O 바운드이므로 CPU 수보다 많은 스레드로 디스크 지연을 겹쳐서 처리
+MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# AI 분석 대상 코드 파일 확장자
+CODE_FILE_EXTENSIONS = frozenset({
+    '.py', '.js', '.jsx', '.ts', '.tsx',  # Python, JavaScript, TypeScript
+    '.go',  # Go
+    '.rs',  # Rust
+    '.java', '.kt', '.kts',  # Java, Kotlin
+    '.php',  # PHP
+    '.cs',  # C#
+    '.rb',  # Ruby
+    '.swift'  # Swift
+})
+
+# 순회 시 하위로 내려가지 않는 디렉토리 이름 (의존성, 가상환경, 빌드 산출물 등)
+EXCLUDE_DIRS = frozenset({
+    'node_modules', 'venv', '.venv', '.git', '__pycache__',
+    'build', 'dist', 'target', 'vendor'
+})
+
+# 압축/번들/생성된 코드 파일명 (리뷰할 가치가 없으므로 열지 않고 제외)
+GENERATED_FILE_PATTERN = re.compile(r'\.min\.|\.bundle\.|_pb2\.|\.generated\.')
+
+# 한 번의 API 요청에 담을 코드 샘플 수
+# (수집된 샘플을 배치로 나눠 병렬 요청 - 동시 요청 수는 settings.MAX_CONCURRENT_REQUESTS로 제한)
+PROMPT_BATCH_SIZE = 10
+
+# API로 보내는 최대 샘플 파일 수 (수집한 샘플 중 점수 상위)
+# 배치로 나눠 보내도 단일 프롬프트 시절과 같은 토큰 예산을 유지
+MAX_PROMPT_FILES = 20
+
+# 429/일시적 네트워크 오류는 SDK 내장 재시도로 요청 단위 처리
+CLAUDE_MAX_RETRIES = 3
+
+# 후보가 max_files의 이 배수보다 많으면 경로 점수 상위 후보만 읽어서 점수 계산
+PATH_PREFILTER_FACTOR = 3
+
+# 파일별 점수 캐시 키 (점수 계산 방식이 바뀌면 버전을 올려 이전 점수를 무효화)
+FILE_SCORE_CACHE_KEY = 'file_scores_v5'
+
+# 배치별 AI 응답 캐시 키 (모드별 항목 하나에 이번 실행에서 쓴 배치의 응답만 저장해
+# 코드가 바뀌어 더 이상 쓰이지 않는 응답이 캐시 파일에 쌓이지 않도록 함)
+RESPONSE_CACHE_KEY = 'ai_responses_{mode}'
+
+# 이보다 큰 파일(번들/생성 파일 등)은 읽지 않음 (핵심 파일명은 앞부분만 읽으므로 예외)
+MAX_SAMPLE_FILE_BYTES = 2 * 1024 * 1024
+
+# 프롬프트에 포함하는 파일당 최대 문자 수 (수집 단계에서 미리 잘라 둠)
+MAX_PROMPT_CHARS_PER_FILE = 2000
+
+# 파일당 읽기 예산 (줄 수 x 이 값 바이트) - 긴 줄이 많은 파일도 메모리 사용량을 제한
+READ_BYTES_PER_LINE = 256
+
+# 파일 앞부분에 NUL 바이트가 있으면 바이너리로 간주 (디코딩 전에 확인)
+BINARY_SNIFF_BYTES = 4096
+
+# High Priority 패턴 파일 목록 (+100점, 1000줄까지 분석)
+HIGH_PRIORITY_PATTERNS = (
+    'main', 'app', 'index', 'server', 'client',
+    'config', 'settings', 'router', 'controller',
+    'service', 'manager', 'handler', 'api'
+)
+HIGH_PRIORITY_PATTERN = re.compile('|'.join(map(re.escape, HIGH_PRIORITY_PATTERNS)))
+
+# 파일명 점수용 Medium(+50)/Low(-30) 우선순위 패턴
+MEDIUM_PRIORITY_PATTERN = re.compile('model|view|component|module')
+LOW_PRIORITY_PATTERN = re.compile('util|helper|common|test|spec')
+
+# 파일 복잡도 점수용 고정 문자열 마커 (bytes.count는 정규식 엔진보다 훨씬 빠름)
+# 모든 마커가 ASCII이므로 파일 내용을 디코딩하지 않고 바이트 그대로 검색
+COMPLEXITY_LITERALS = {
+    'function': (b'def ', b'function ', b'func '),  # Python, JavaScript, Go/Swift
+    'class': (b'class ', b'struct ', b'interface '),  # Python/Java/C#/JS, Go/Rust, TS/Java
+    'import': (b'import ', b'require(', b'use '),  # Python/JS/Java, JavaScript, Rust/PHP
+}
+
+# 고정 문자열로 표현할 수 없는 패턴만 정규식으로 검색
+COMPLEXITY_PATTERN = re.compile(
+    rb'(?P<function>public\s+\w+\s+\w+\s*\()'  # Java/C#
+    rb'|(?P<import>from\s+\w+\s+import)'  # Python
+)
+
+# 복잡도 카테고리별 가중치: 함수(+5/개), 클래스(+10/개), import(+3/개)
+COMPLEXITY_WEIGHTS = {'function': 5, 'class': 10, 'import': 3}
+
+# 경로 점수만으로 이 값 이상이면 (예: 얕은 경로의 High Priority 파일) 복잡도 정규식 분석을 생략
+FAST_ACCEPT_PATH_SCORE = 120
+
+# 복잡도 분석을 생략한 파일의 추정 복잡도 점수 (1KB당, 일반적인 소스의 함수/클래스/import 밀도 기준)
+# 0점으로 두면 깊은 경로의 복잡한 파일에 순위가 밀리므로 파일 크기로 근사
+ESTIMATED_COMPLEXITY_PER_KB = 6
+
+# 요약(summary)에 집계하는 심각도 순서
+SUMMARY_SEVERITIES = ('critical', 'warning', 'info')
+
+# 프롬프트가 요구하는 표준 이슈 헤더 형식 (예: **[Critical] 제목**)
+ISSUE_HEADER_PATTERN = re.compile(
+    r'^\*\*\[?(Critical|Warning|Info)\b\]?:?\s*(.*?)\*\*$', re.IGNORECASE
+)
+
+# AI 응답의 심각도 마커 패턴
+SEVERITY_MARKER_PATTERNS = (
+    ('critical', (
+        r'\*\*\[?Critical\]?', r'\*\*Critical', r'Critical:', r'🔴',
+        r'\[Critical\]', r'CRITICAL', r'치명적', r'긴급',
+    )),
+    ('warning', (
+        r'\*\*\[?Warning\]?', r'\*\*Warning', r'Warning:', r'🟡',
+        r'\[Warning\]', r'WARNING', r'경고',
+    )),
+    ('info', (
+        r'\*\*\[?Info\]?', r'\*\*Info', r'Info:', r'🟢',
+        r'\[Info\]', r'INFO', r'정보', r'제안',
+    )),
+)
+
+# 프롬프트가 요구하는 이슈 상세 항목 접두어 (이 줄들은 심각도 마커를 검색하지 않음)
+DETAIL_FIELD_PREFIXES = ('- 설명:', '- 파일:', '- 위치:', '- 제안:')
+
+# 상세 정보 줄로 취급하는 글머리 기호
+DETAIL_BULLETS = frozenset('-•*')
+
+# 심각도 감지용: 모든 마커를 named group 하나로 합쳐 줄마다 한 번만 검색 (lastgroup = 심각도)
+SEVERITY_PATTERN = re.compile(
+    '|'.join(f"(?P<{severity}>{'|'.join(patterns)})" for severity, patterns in SEVERITY_MARKER_PATTERNS),
+    re.IGNORECASE
+)
+
+# 제목 추출용: 감지된 심각도의 마커를 모두 제거
+SEVERITY_MARKERS = {
+    severity: re.compile('|'.join(patterns), re.IGNORECASE)
+    for severity, patterns in SEVERITY_MARKER_PATTERNS
+}
+
+
+# 모드별 분석 체크리스트 (프롬프트 footer에 그대로 삽입)
+DEPLOYMENT_CHECKLIST = """
+**🔴 Critical (치명적) - 즉시 수정 필요:**
+1. 보안 취약점:
+   - SQL Injection, XSS, CSRF 취약점
+   - 하드코딩된 비밀번호/API 키
+   - 인증/인가 로직 누락
+   - 암호화되지 않은 민감 정보 전송
+   - 파일 업로드 검증 부족
+   - 경로 조작 취약점 (Path Traversal)
+   
+2. 치명적 버그:
+   - Null 포인터 역참조 가능성
+   - 메모리 누수
+   - 무한 루프/재귀
+   - 예외 처리 누락으로 인한 크래시
+   - 데이터 손실 위험 (트랜잭션 미사용 등)
+
+**🟡 Warning (경고) - 배포 전 수정 권장:**
+1. 성능 이슈:
+   - N+1 쿼리 문제
+   - 비효율적인 알고리즘 (O(n²) 이상)
+   - 불필요한 반복문/재귀
+   - 대용량 데이터 처리 시 메모리 부족 가능성
+   - 캐싱 미적용으로 인한 성능 저하
+   
+2. 확장성 문제:
+   - 하드코딩된 리소스 제한
+   - 단일 스레드 병목
+   - 상태 저장으로 인한 확장 불가
+   - 분산 환경 비호환 코드
+   
+3. CI/CD 문제:
+   - 테스트 커버리지 부족
+   - 빌드/배포 스크립트 오류 가능성
+   - 환경 변수 관리 부실
+   - 로깅/모니터링 부재"""
+
+PERSONAL_CHECKLIST = """
+**🔴 Critical (치명적) - 즉시 수정 필요:**
+1. 코드 품질 문제:
+   - 복잡도가 과도한 함수/메서드 (순환 복잡도 > 15)
+   - 중복 코드 블록 (DRY 원칙 위반)
+   - 매직 넘버/문자열 하드코딩
+   - 전역 변수 남용
+   
+2. 유지보수성 문제:
+   - 명확하지 않은 변수/함수명
+   - 주석 부족 또는 오래된 주석
+   - 책임이 불명확한 클래스/모듈
+   - 의존성 과다 결합
+
+**🟡 Warning (경고) - 개선 권장:**
+1. 가독성 문제:
+   - 긴 함수/메서드 (100줄 이상)
+   - 깊은 중첩 구조 (4단계 이상)
+   - 일관성 없는 코딩 스타일
+   - 불필요한 복잡성
+   
+2. 중복 코드:
+   - 동일한 로직 반복
+   - 유사한 함수/메서드 다수
+   - 복사-붙여넣기 코드
+   
+3. 설계 문제:
+   - 단일 책임 원칙 위반
+   - 개방-폐쇄 원칙 미준수
+   - 인터페이스 분리 원칙 위반"""
+
+# 모드와 무관한 공통 Info 항목
+INFO_CHECKLIST = """
+**🟢 Info (정보) - 개선 제안:**
+1. 코드 스타일:
+   - PEP 8 / 코딩 컨벤션 미준수
+   - 타입 힌트 부족
+   - 문서화 개선 필요
+   
+2. 리팩토링 제안:
+   - 더 나은 패턴 적용 가능성
+   - 라이브러리/프레임워크 활용 개선
+   - 성능 최적화 여지
+   - 테스트 가능성 향상"""
+
+# Claude API 예외 타입별 사용자 안내 메시지 (위에서부터 isinstance로 매칭)
+API_ERROR_MESSAGES = (
+    (anthropic.APIConnectionError, 'Failed to connect to Claude API: {error}. Check your internet connection.'),
+    (anthropic.RateLimitError, 'API rate limit exceeded: {error}. Please try again later.'),
+    (anthropic.AuthenticationError, 'Authentication failed: {error}. Check your ANTHROPIC_API_KEY.'),
+)
+
+
+def _empty_summary() -> Dict[str, Any]:
+    """Return a new zero-issue summary (fresh dict, callers may mutate it)."""
+    return {'total_issues': 0, 'by_severity': dict.fromkeys(SUMMARY_SEVERITIES, 0)}
+
+
+def _decode_prompt_content(data: bytes) -> str:
+    """
+    프롬프트에 쓸 앞부분만 UTF-8로 디코딩합니다 (MAX_PROMPT_CHARS_PER_FILE자로 제한).
+
+    Args:
+        data: 파일에서 읽은 바이트
+
+    Returns:
+        줄바꿈을 LF로 통일한 텍스트
+    """
+    # UTF-8 한 글자는 최대 4바이트이므로 이만큼만 디코딩해도 글자 수 제한을 채움
+    text = data[:MAX_PROMPT_CHARS_PER_FILE * 4].decode('utf-8', errors='ignore')
+    return text.replace('\r\n', '\n').replace('\r', '\n')[:MAX_PROMPT_CHARS_PER_FILE]
+
+
+def _api_error_message(error: Exception) -> str:
+    """Return the user-facing message for a Claude API error."""
+    for error_type, template in API_ERROR_MESSAGES:
+        if isinstance(error, error_type):
+            return template.format(error=error)
+    return f'Claude API error: {error}'
+
 
 class AIAnalyzer:
     """Performs AI-based code review using Claude Code API."""
 
-    def __init__(self, project_path: Path, mode: str):
+    def __init__(
+        self,
+        project_path: Path,
+        mode: str,
+        use_cache: bool = True,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS
+    ):
         """
         Initialize the AI analyzer.
 
         Args:
             project_path: Path to the project directory
             mode: Analysis mode ('deployment' or 'personal')
+            use_cache: Whether to reuse cached results for unchanged code samples
+            max_concurrent_requests: Maximum number of Claude API requests in flight
+                (lower it if the API key has a tight rate limit)
         """
         self.project_path = project_path
         self.mode = mode
-        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        self.use_cache = use_cache
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.cache_manager = CacheManager(project_path) if use_cache else None
+        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=CLAUDE_MAX_RETRIES)
         self.mode_config = ANALYSIS_MODES[mode]
         self.analyzed_files: Set[str] = set()  # Track analyzed files to avoid duplicates
-        
-        # High Priority 패턴 파일 목록 (1000줄까지 분석)
-        self.high_priority_patterns = [
-            'main', 'app', 'index', 'server', 'client',
-            'config', 'settings', 'router', 'controller',
-            'service', 'manager', 'handler', 'api'
-        ]
 
-    def _calculate_file_score(self, file_path: Path, content: str) -> float:
+        # 모드별로 고정된 프롬프트 부분은 한 번만 생성
+        self._prompt_header, self._prompt_footer = self._build_prompt_sections()
+
+    def _path_score(self, relative_path: str) -> float:
+        """
+        파일명 패턴과 경로 깊이만으로 점수를 계산합니다 (파일을 읽지 않음).
+
+        Args:
+            relative_path: 프로젝트 기준 상대 경로
+
+        Returns:
+            경로 기반 점수 (_calculate_file_score의 1, 2번 기준)
+        """
+        score = 0.0
+        filename = os.path.basename(relative_path).lower()
+
+        # 1. Filename pattern scoring (most important)
+        # 패턴 목록마다 하나의 alternation으로 파일명을 한 번만 검색
+        if HIGH_PRIORITY_PATTERN.search(filename):
+            score += 100
+        if MEDIUM_PRIORITY_PATTERN.search(filename):
+            score += 50
+        # Penalty for utility files (일치하는 패턴 종류마다 감점)
+        score -= 30 * len(set(LOW_PRIORITY_PATTERN.findall(filename)))
+
+        # 2. Path depth (prefer files closer to root)
+        depth = relative_path.count(os.sep) + 1
+        score += max(0, 50 - (depth * 10))  # Closer to root = higher score
+
+        return score
+
+    def _calculate_file_score(
+        self,
+        relative_path: str,
+        content: bytes,
+        line_count: int,
+        is_high_priority: bool
+    ) -> float:
         """
         파일의 중요도 점수를 계산합니다.
         
@@ -47,6 +351,7 @@ class AIAnalyzer:
         1. 파일명 패턴: High(+100), Medium(+50), Low(-30)
         2. 경로 깊이: 루트에 가까울수록 높은 점수 (최대 +50)
         3. 복잡도: 함수(+5/개), 클래스(+10/개), import(+3/개)
+           - 1, 2번 합계가 FAST_ACCEPT_PATH_SCORE 이상이면 정규식 분석 대신 파일 크기로 추정
         4. 파일 크기: 
            - High Priority: 50-1000줄(+20), 1000줄 초과(+10)
            - 일반 파일: 50-500줄(+20), 500줄 초과(+10)
@@ -54,75 +359,32 @@ class AIAnalyzer:
         상세 점수 계산 로직은 docs/FILE_SELECTION_LOGIC.md 참조
 
         Args:
-            file_path: 파일 경로
-            content: 파일 내용
+            relative_path: 프로젝트 기준 상대 경로
+            content: 파일 내용 (디코딩하지 않은 바이트)
+            line_count: 읽은 줄 수 (수집 단계에서 전달받아 내용을 다시 분할하지 않음)
+            is_high_priority: High Priority 패턴 파일 여부 (수집 단계에서 이미 판별)
 
         Returns:
             중요도 점수 (높을수록 중요)
         """
-        score = 0.0
-        filename = file_path.name.lower()
-
-        # 1. Filename pattern scoring (most important)
-        # High Priority 패턴은 인스턴스 변수에서 가져옴 (1000줄까지 분석)
-        high_priority_patterns = self.high_priority_patterns
-        medium_priority_patterns = ['model', 'view', 'component', 'module']
-        low_priority_patterns = ['util', 'helper', 'common', 'test', 'spec']
-
-        for pattern in high_priority_patterns:
-            if pattern in filename:
-                score += 100
-                break
-        for pattern in medium_priority_patterns:
-            if pattern in filename:
-                score += 50
-                break
-        for pattern in low_priority_patterns:
-            if pattern in filename:
-                score -= 30  # Penalty for utility files
-
-        # 2. Path depth (prefer files closer to root)
-        depth = len(file_path.relative_to(self.project_path).parts)
-        score += max(0, 50 - (depth * 10))  # Closer to root = higher score
+        # 1-2. Filename pattern and path depth (파일을 읽지 않고 계산 가능)
+        score = self._path_score(relative_path)
 
         # 3. Complexity analysis
-        lines = content.split('\n')
-
-        # Count functions/methods
-        func_patterns = [
-            r'def\s+\w+',  # Python
-            r'function\s+\w+',  # JavaScript
-            r'func\s+\w+',  # Go/Swift
-            r'public\s+\w+\s+\w+\s*\(',  # Java/C#
-        ]
-        func_count = sum(len(re.findall(pattern, content)) for pattern in func_patterns)
-        score += func_count * 5
-
-        # Count classes
-        class_patterns = [
-            r'class\s+\w+',  # Python/Java/C#/JavaScript
-            r'struct\s+\w+',  # Go/Rust
-            r'interface\s+\w+',  # TypeScript/Java
-        ]
-        class_count = sum(len(re.findall(pattern, content)) for pattern in class_patterns)
-        score += class_count * 10
-
-        # Count imports (indicates connections to other modules)
-        import_patterns = [
-            r'import\s+',  # Python/JavaScript/Java
-            r'from\s+\w+\s+import',  # Python
-            r'require\(',  # JavaScript
-            r'use\s+',  # Rust/PHP
-        ]
-        import_count = sum(len(re.findall(pattern, content)) for pattern in import_patterns)
-        score += import_count * 3
+        # Count functions/methods, classes and imports
+        # 경로 점수만으로 이미 상위권인 파일은 정규식 검색 없이 파일 크기로 복잡도를 추정
+        if score >= FAST_ACCEPT_PATH_SCORE:
+            score += len(content) * ESTIMATED_COMPLEXITY_PER_KB / 1024
+        else:
+            complexity_counts = Counter(m.lastgroup for m in COMPLEXITY_PATTERN.finditer(content))
+            for group, literals in COMPLEXITY_LITERALS.items():
+                complexity_counts[group] += sum(content.count(literal) for literal in literals)
+            score += sum(
+                COMPLEXITY_WEIGHTS[group] * count for group, count in complexity_counts.items()
+            )
 
         # 4. File size (larger files often more important, but not too large)
-        line_count = len(lines)
         # High Priority 파일은 1000줄까지 읽으므로 점수 계산 기준 조정
-        filename_lower = file_path.name.lower()
-        is_high_priority = any(pattern in filename_lower for pattern in self.high_priority_patterns)
-        
         if is_high_priority:
             # High Priority 파일: 50-1000줄 범위가 최적
             if 50 <= line_count <= 1000:
@@ -138,6 +400,234 @@ class AIAnalyzer:
 
         return score
 
+    def _iter_code_entries(self, exclude_dirs: FrozenSet[str]) -> Iterator[os.DirEntry]:
+        """
+        os.scandir 기반으로 프로젝트를 순회하며 코드 파일 엔트리를 반환합니다.
+
+        제외 디렉토리는 하위로 내려가기 전에 가지치기하므로 node_modules 등은
+        아예 순회하지 않습니다. 심볼릭 링크 디렉토리는 따라가지 않습니다.
+        너비 우선으로 순회하므로 얕은 경로의 파일이 먼저 반환됩니다.
+
+        Args:
+            exclude_dirs: 순회하지 않을 디렉토리 이름 집합
+
+        Yields:
+            확장자가 CODE_FILE_EXTENSIONS에 속하고 생성된 파일이 아닌 파일의 DirEntry
+        """
+        # 너비 우선 순회: 루트에 가까운(깊이 점수가 높은) 파일부터 반환
+        pending = deque([str(self.project_path)])
+        while pending:
+            directory = pending.popleft()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in exclude_dirs:
+                                pending.append(entry.path)
+                            continue
+
+                        dot = name.rfind('.')
+                        if (dot > 0 and name[dot:] in CODE_FILE_EXTENSIONS
+                                and not GENERATED_FILE_PATTERN.search(name) and entry.is_file()):
+                            yield entry
+            except OSError as e:
+                logger.debug("Failed to scan %s: %s", directory, e)
+
+    def _find_candidate_files(self, skip_analyzed: bool) -> List[str]:
+        """
+        분석 후보 파일 경로를 수집합니다 (파일 내용은 읽지 않음).
+
+        경로 메타데이터(제외 디렉토리, 확장자, 분석 이력, 파일 크기)만으로 필터링하므로
+        실제 파일 읽기는 _read_and_score 단계에서 병렬로 수행됩니다.
+        깊이나 순회 순서로 후보를 자르지 않으며, 후보가 많으면 _collect_code_samples에서
+        전체 후보의 경로 점수 상위만 읽습니다.
+
+        Args:
+            skip_analyzed: 이미 분석한 파일 건너뛰기 여부
+
+        Returns:
+            후보 파일의 프로젝트 기준 상대 경로 리스트
+        """
+        # Path 객체 생성/relative_to 대신 DirEntry.path 문자열을 잘라서 상대 경로 계산
+        prefix_len = len(os.path.join(str(self.project_path), ''))
+
+        candidates = []
+        for entry in self._iter_code_entries(EXCLUDE_DIRS):
+            # Skip already analyzed files if requested
+            relative_path = entry.path[prefix_len:]
+            if skip_analyzed and relative_path in self.analyzed_files:
+                continue
+
+            # 빈 파일/대용량 파일(번들, 생성 파일 등)은 열지 않고 DirEntry 크기로 제외
+            try:
+                file_size = entry.stat(follow_symlinks=False).st_size
+            except OSError as e:
+                logger.debug("Failed to stat %s: %s", relative_path, e)
+                continue
+            if file_size == 0:
+                continue
+            if file_size > MAX_SAMPLE_FILE_BYTES and not self._is_high_priority(relative_path):
+                logger.debug("Skipping large file: %s", relative_path)
+                continue
+
+            candidates.append(relative_path)
+
+        return candidates
+
+    def _read_head(self, file_path: str, max_lines: int) -> Optional[Tuple[bytes, int]]:
+        """
+        파일 앞부분을 최대 max_lines줄까지 바이트로 읽습니다 (디코딩하지 않음).
+
+        Args:
+            file_path: 읽을 파일 경로
+            max_lines: 최대 읽을 줄 수
+
+        Returns:
+            (읽은 바이트, 줄 수), 바이너리 파일이거나 내용이 비어 있으면 None
+        """
+        # 줄 수에 비례한 바이트 예산만큼 한 번에 읽음 (줄 단위 객체 생성 없음)
+        with open(file_path, 'rb') as raw:
+            data = raw.read(max_lines * READ_BYTES_PER_LINE)
+
+        # 확장자만 코드 파일인 바이너리는 건너뛰기
+        if b'\x00' in data[:BINARY_SNIFF_BYTES]:
+            logger.debug("Skipping binary file: %s", file_path)
+            return None
+        if not data.strip():  # Skip empty files
+            return None
+
+        # max_lines번째 줄바꿈 뒤는 잘라냄 (줄이 적으면 탐색하지 않음)
+        newline_count = data.count(b'\n')
+        if newline_count >= max_lines:
+            end = -1
+            for _ in range(max_lines):
+                end = data.find(b'\n', end + 1)
+            data = data[:end + 1]
+            newline_count = max_lines
+
+        line_count = newline_count if data.endswith(b'\n') else newline_count + 1
+        return data, line_count
+
+    def _is_high_priority(self, relative_path: str) -> bool:
+        """파일명이 High Priority 패턴에 해당하는지 확인합니다 (1000줄까지 분석)."""
+        filename_lower = os.path.basename(relative_path).lower()
+        return HIGH_PRIORITY_PATTERN.search(filename_lower) is not None
+
+    def _read_and_score(
+        self,
+        relative_path: str,
+        score_cache: Optional[Dict[str, List[Any]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        파일 하나를 읽고 중요도 점수를 계산합니다 (스레드 풀 워커에서 실행).
+
+        score_cache에 같은 (mtime_ns, size)로 저장된 점수가 있으면 파일을 읽지 않고
+        재사용하며, 이때 content는 None으로 반환됩니다 (선정된 경우에만 나중에 읽음).
+
+        Args:
+            relative_path: 후보 파일의 프로젝트 기준 상대 경로
+            score_cache: 상대 경로 -> [mtime_ns, size, score, fingerprint] 형태의 이전 점수
+
+        Returns:
+            점수가 포함된 파일 정보, 빈 파일이거나 읽기 실패 시 None
+        """
+        file_path = os.path.join(self.project_path, relative_path)
+
+        try:
+            stat = os.stat(file_path)
+            signature = [stat.st_mtime_ns, stat.st_size]
+
+            cached = score_cache.get(relative_path) if score_cache else None
+            if cached and cached[:2] == signature:
+                return {
+                    'path': relative_path,
+                    'content': None,
+                    'extension': os.path.splitext(relative_path)[1],
+                    'score': cached[2],
+                    'fingerprint': cached[3],
+                    'signature': signature
+                }
+
+            # Read file content (High Priority는 1000줄, 일반은 500줄로 제한)
+            # 파일명 패턴 검사는 한 번만 하고 점수 계산에도 그대로 전달
+            is_high_priority = self._is_high_priority(relative_path)
+            head = self._read_head(file_path, 1000 if is_high_priority else 500)
+            if head is None:
+                return None
+            data, line_count = head
+
+            # Calculate importance score (점수 패턴은 ASCII이므로 바이트 그대로 계산)
+            score = self._calculate_file_score(relative_path, data, line_count, is_high_priority)
+
+            # 점수는 읽은 전체 내용으로 계산하고, 프롬프트에 쓰일 부분만 디코딩해 보관
+            return {
+                'path': relative_path,
+                'content': _decode_prompt_content(data),
+                'extension': os.path.splitext(relative_path)[1],
+                'score': score,
+                'fingerprint': hashlib.blake2b(data, digest_size=16).hexdigest(),
+                'signature': signature
+            }
+
+        except (IOError, OSError, UnicodeDecodeError) as e:
+            logger.debug("Failed to read %s: %s", file_path, e)
+            return None
+
+    def _load_sample_content(self, file_info: Dict[str, Any]) -> Optional[str]:
+        """
+        점수 캐시로 선정되어 아직 읽지 않은 파일의 프롬프트용 내용을 읽습니다.
+
+        Args:
+            file_info: _read_and_score가 반환한 파일 정보
+
+        Returns:
+            MAX_PROMPT_CHARS_PER_FILE자로 자른 내용, 읽기 실패 시 None
+        """
+        if file_info['content'] is not None:
+            return file_info['content']
+
+        file_path = os.path.join(self.project_path, file_info['path'])
+        try:
+            max_lines = 1000 if self._is_high_priority(file_info['path']) else 500
+            head = self._read_head(file_path, max_lines)
+        except (IOError, OSError) as e:
+            logger.debug("Failed to read %s: %s", file_path, e)
+            return None
+        if head is None:
+            return None
+        return _decode_prompt_content(head[0])
+
+    def _load_score_cache(self) -> Dict[str, List[Any]]:
+        """이전 실행에서 저장한 파일별 점수를 불러옵니다 (캐시 미사용 시 빈 dict)."""
+        if not self.cache_manager:
+            return {}
+        return self.cache_manager.get_cached_result(FILE_SCORE_CACHE_KEY) or {}
+
+    def _save_score_cache(self, score_cache: Dict[str, List[Any]], file_scores: List[Dict[str, Any]]) -> None:
+        """
+        이번 실행에서 계산한 파일별 점수를 저장합니다.
+
+        Args:
+            score_cache: 이전 점수 캐시
+            file_scores: 이번에 점수를 계산한(또는 재사용한) 파일 정보 리스트
+        """
+        if not self.cache_manager:
+            return
+
+        # 이번 후보에서 빠진 이미 분석한 파일의 점수는 유지하고, 나머지는 새 점수로 교체
+        updated = {
+            path: entry for path, entry in score_cache.items() if path in self.analyzed_files
+        }
+        for info in file_scores:
+            updated[info['path']] = info['signature'] + [info['score'], info['fingerprint']]
+
+        try:
+            self.cache_manager.save_result(FILE_SCORE_CACHE_KEY, updated)
+        except (IOError, OSError, UnicodeError) as e:
+            # UnicodeError: 디코딩할 수 없는 파일명(surrogate escape)은 UTF-8로 저장 불가
+            logger.warning("Failed to cache file scores: %s", e)
+
     def _collect_code_samples(self, max_files: int = 50, skip_analyzed: bool = True) -> List[Dict[str, str]]:
         """
         프로젝트에서 스마트하게 선정된 코드 샘플을 수집합니다.
@@ -160,71 +650,52 @@ class AIAnalyzer:
 
         Returns:
             중요도 순으로 정렬된 코드 샘플 리스트
+            (content는 최대 500/1000줄, MAX_PROMPT_CHARS_PER_FILE자로 제한)
         """
-        exclude_dirs = {'node_modules', 'venv', '.venv', '.git', '__pycache__', 'build', 'dist', 'target', 'vendor'}
-        file_extensions = {
-            '.py', '.js', '.jsx', '.ts', '.tsx',  # Python, JavaScript, TypeScript
-            '.go',  # Go
-            '.rs',  # Rust
-            '.java', '.kt', '.kts',  # Java, Kotlin
-            '.php',  # PHP
-            '.cs',  # C#
-            '.rb',  # Ruby
-            '.swift'  # Swift
-        }
-
-        # Collect all eligible files with scores
-        file_scores = []
-
-        for file_path in self.project_path.rglob('*'):
-            # Skip excluded directories
-            if any(excluded in file_path.parts for excluded in exclude_dirs):
-                continue
-
-            # Only include relevant code files
-            if not (file_path.is_file() and file_path.suffix in file_extensions):
-                continue
-
-            # Skip already analyzed files if requested
-            relative_path = str(file_path.relative_to(self.project_path))
-            if skip_analyzed and relative_path in self.analyzed_files:
-                continue
-
-            try:
-                # High Priority 패턴 파일은 1000줄, 일반 파일은 500줄까지 읽기
-                filename_lower = file_path.name.lower()
-                is_high_priority = any(pattern in filename_lower for pattern in self.high_priority_patterns)
-                max_lines = 1000 if is_high_priority else 500
-                
-                # Read file content (High Priority는 1000줄, 일반은 500줄로 제한)
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()[:max_lines]
-                    content = ''.join(lines)
-                    
-                if is_high_priority:
-                    logger.debug("High Priority file detected: %s (reading %d lines)", relative_path, len(lines))
-
-                if not content.strip():  # Skip empty files
-                    continue
-
-                # Calculate importance score
-                score = self._calculate_file_score(file_path, content)
-
-                file_scores.append({
-                    'path': relative_path,
-                    'full_path': file_path,
-                    'content': content,
-                    'extension': file_path.suffix,
-                    'score': score
-                })
-
-            except (IOError, OSError, UnicodeDecodeError) as e:
-                logger.debug("Failed to read %s: %s", file_path, e)
-                continue
-
-        # Sort by score (descending) and take top N
-        file_scores.sort(key=lambda x: x['score'], reverse=True)
-        selected_files = file_scores[:max_files]
+        candidates = self._find_candidate_files(skip_analyzed)
+        score_cache = self._load_score_cache()
+
+        # 후보가 많으면 파일을 읽지 않고 계산 가능한 경로 점수로 먼저 추림
+        prefilter_size = max_files * PATH_PREFILTER_FACTOR
+        if len(candidates) > prefilter_size:
+            logger.info("Prefiltering %d candidates to %d by path score", len(candidates), prefilter_size)
+            candidates = heapq.nlargest(prefilter_size, candidates, key=self._path_score)
+
+        # Read and score candidates concurrently (map() keeps the walk order)
+        # 변경되지 않은 파일은 점수 캐시를 재사용하므로 읽지 않음
+        # 상위 max_files 후보만 min-heap에 유지하고, 밀려난 파일의 내용은 바로 버림
+        # (버린 파일이 중복 제거로 다시 선정되면 _load_sample_content에서 다시 읽음)
+        file_scores: List[Dict[str, Any]] = []
+        top_files: List[Tuple[float, int, Dict[str, Any]]] = []
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            results = executor.map(lambda path: self._read_and_score(path, score_cache), candidates)
+            for index, info in enumerate(filter(None, results)):
+                file_scores.append(info)
+                # 동점이면 나중에 읽은 파일이 먼저 밀려남 (nlargest의 순서 유지와 일치)
+                entry = (info['score'], -index, info)
+                if len(top_files) < max_files:
+                    heapq.heappush(top_files, entry)
+                else:
+                    heapq.heappushpop(top_files, entry)[2]['content'] = None
+
+        # 내용이 같은 파일(복사본, vendored 사본 등)은 점수가 가장 높은 하나만 남김
+        unique_files: Dict[str, Dict[str, Any]] = {}
+        for info in file_scores:
+            best = unique_files.get(info['fingerprint'])
+            if best is None or info['score'] > best['score']:
+                unique_files[info['fingerprint']] = info
+        if len(unique_files) < len(file_scores):
+            logger.debug("Skipped %d duplicate files", len(file_scores) - len(unique_files))
+
+        # Take top N by score (descending) without sorting every candidate
+        selected_files = heapq.nlargest(max_files, unique_files.values(), key=lambda x: x['score'])
+
+        # 점수 캐시로 선정된 파일만 지금 내용을 읽음
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            contents = list(executor.map(self._load_sample_content, selected_files))
+        for file_info, content in zip(selected_files, contents):
+            file_info['content'] = content
+        selected_files = [f for f in selected_files if f['content'] is not None]
 
         logger.info("Selected %d files from %d candidates", len(selected_files), len(file_scores))
         if selected_files:
@@ -234,6 +705,8 @@ class AIAnalyzer:
         for file_info in selected_files:
             self.analyzed_files.add(file_info['path'])
 
+        self._save_score_cache(score_cache, file_scores)
+
         # Return samples without score (for API call)
         return [{
             'path': f['path'],
@@ -241,111 +714,22 @@ class AIAnalyzer:
             'extension': f['extension']
         } for f in selected_files]
 
-    def _build_analysis_prompt(self, code_samples: List[Dict[str, str]]) -> str:
+    def _build_prompt_sections(self) -> Tuple[str, str]:
         """
-        Build optimized prompt for Claude Code API with mode-specific instructions.
-
-        Args:
-            code_samples: List of code samples to analyze
+        모드별로 고정된 프롬프트 앞/뒤 부분을 만듭니다 (인스턴스 생성 시 한 번만 호출).
 
         Returns:
-            Formatted prompt string
+            (코드 샘플 앞에 오는 header, 코드 샘플 뒤에 오는 footer)
         """
-        mode_name = self.mode_config['name']
-        priorities = ', '.join(self.mode_config['priorities'])
-        description = self.mode_config['description']
+        mode_config = self.mode_config
+        mode_name = mode_config['name']
+        priorities = ', '.join(mode_config['priorities'])
+        description = mode_config['description']
 
-        # Build code context with file information
-        code_context = ""
-        file_count = len(code_samples)
-        for idx, sample in enumerate(code_samples[:20], 1):  # 최대 20개 파일만 포함
-            code_context += f"\n\n### File {idx}/{file_count}: {sample['path']}\n```{sample['extension'][1:]}\n{sample['content'][:2000]}\n```"
-
-        # 모드별 구체적인 분석 체크리스트 생성
-        if self.mode == 'deployment':
-            analysis_checklist = """
-**🔴 Critical (치명적) - 즉시 수정 필요:**
-1. 보안 취약점:
-   - SQL Injection, XSS, CSRF 취약점
-   - 하드코딩된 비밀번호/API 키
-   - 인증/인가 로직 누락
-   - 암호화되지 않은 민감 정보 전송
-   - 파일 업로드 검증 부족
-   - 경로 조작 취약점 (Path Traversal)
-   
-2. 치명적 버그:
-   - Null 포인터 역참조 가능성
-   - 메모리 누수
-   - 무한 루프/재귀
-   - 예외 처리 누락으로 인한 크래시
-   - 데이터 손실 위험 (트랜잭션 미사용 등)
+        # 모드별 체크리스트는 모듈 상수로 미리 정의됨
+        analysis_checklist = DEPLOYMENT_CHECKLIST if self.mode == 'deployment' else PERSONAL_CHECKLIST
 
-**🟡 Warning (경고) - 배포 전 수정 권장:**
-1. 성능 이슈:
-   - N+1 쿼리 문제
-   - 비효율적인 알고리즘 (O(n²) 이상)
-   - 불필요한 반복문/재귀
-   - 대용량 데이터 처리 시 메모리 부족 가능성
-   - 캐싱 미적용으로 인한 성능 저하
-   
-2. 확장성 문제:
-   - 하드코딩된 리소스 제한
-   - 단일 스레드 병목
-   - 상태 저장으로 인한 확장 불가
-   - 분산 환경 비호환 코드
-   
-3. CI/CD 문제:
-   - 테스트 커버리지 부족
-   - 빌드/배포 스크립트 오류 가능성
-   - 환경 변수 관리 부실
-   - 로깅/모니터링 부재"""
-        else:  # personal mode
-            analysis_checklist = """
-**🔴 Critical (치명적) - 즉시 수정 필요:**
-1. 코드 품질 문제:
-   - 복잡도가 과도한 함수/메서드 (순환 복잡도 > 15)
-   - 중복 코드 블록 (DRY 원칙 위반)
-   - 매직 넘버/문자열 하드코딩
-   - 전역 변수 남용
-   
-2. 유지보수성 문제:
-   - 명확하지 않은 변수/함수명
-   - 주석 부족 또는 오래된 주석
-   - 책임이 불명확한 클래스/모듈
-   - 의존성 과다 결합
-
-**🟡 Warning (경고) - 개선 권장:**
-1. 가독성 문제:
-   - 긴 함수/메서드 (100줄 이상)
-   - 깊은 중첩 구조 (4단계 이상)
-   - 일관성 없는 코딩 스타일
-   - 불필요한 복잡성
-   
-2. 중복 코드:
-   - 동일한 로직 반복
-   - 유사한 함수/메서드 다수
-   - 복사-붙여넣기 코드
-   
-3. 설계 문제:
-   - 단일 책임 원칙 위반
-   - 개방-폐쇄 원칙 미준수
-   - 인터페이스 분리 원칙 위반"""
-
-        # 공통 Info 항목
-        info_checklist = """
-**🟢 Info (정보) - 개선 제안:**
-1. 코드 스타일:
-   - PEP 8 / 코딩 컨벤션 미준수
-   - 타입 힌트 부족
-   - 문서화 개선 필요
-   
-2. 리팩토링 제안:
-   - 더 나은 패턴 적용 가능성
-   - 라이브러리/프레임워크 활용 개선
-   - 성능 최적화 여지
-   - 테스트 가능성 향상"""
-
-        prompt = f"""당신은 10년 이상 경력의 시니어 코드 리뷰어입니다. 다음 프로젝트를 "{mode_name}" 관점에서 철저히 분석해주세요.
+        header = f"""당신은 10년 이상 경력의 시니어 코드 리뷰어입니다. 다음 프로젝트를 "{mode_name}" 관점에서 철저히 분석해주세요.
 
 ## 📋 분석 컨텍스트
 
@@ -353,16 +737,15 @@ class AIAnalyzer:
 **우선순위**: {priorities}
 **설명**: {description}
 
-**분석 대상**: 총 {file_count}개 파일 (주요 파일 {min(20, file_count)}개 샘플 제공)
+"""
 
-## 📁 코드 샘플
-{code_context}
+        footer = f"""
 
 ## 🔍 분석 체크리스트
 
 {analysis_checklist}
 
-{info_checklist}
+{INFO_CHECKLIST}
 
 ## 📝 응답 형식 (반드시 준수)
 
@@ -387,7 +770,7 @@ class AIAnalyzer:
 
 ## ✅ 응답 요구사항
 
-1. **최소 이슈 수**: 최소 5개 이상의 이슈를 찾아주세요. 코드가 완벽해 보여도 개선 가능한 부분을 찾아주세요.
+1. **이슈 수**: 이 요청에는 전체 샘플 중 일부 파일만 포함되어 있습니다. 제공된 코드에서 실제로 확인되는 문제만 보고하고, 문제가 없으면 이슈를 억지로 만들지 마세요.
 
 2. **우선순위**: Critical → Warning → Info 순서로 정렬해주세요.
 
@@ -416,7 +799,47 @@ class AIAnalyzer:
 
 이제 분석을 시작해주세요."""
 
-        return prompt
+        return header, footer
+
+    def _build_analysis_prompt(
+        self,
+        code_samples: List[Dict[str, str]],
+        total_files: Optional[int] = None,
+        first_index: int = 1
+    ) -> str:
+        """
+        Build optimized prompt for Claude Code API with mode-specific instructions.
+
+        Args:
+            code_samples: List of code samples to analyze (한 배치)
+            total_files: 프로젝트에서 선정한 전체 샘플 파일 수 (None이면 code_samples 개수)
+            first_index: 배치 첫 파일의 전체 샘플 기준 번호 (1부터)
+
+        Returns:
+            Formatted prompt string
+        """
+        code_samples = code_samples[:MAX_PROMPT_FILES]
+        if total_files is None:
+            total_files = len(code_samples)
+        last_index = first_index + len(code_samples) - 1
+
+        # Build code context with file information
+        # 문자열 += 반복 대신 리스트에 모은 뒤 한 번에 join (O(N) 복사)
+        context_parts = []
+        for idx, sample in enumerate(code_samples, first_index):
+            context_parts.append(
+                f"\n\n### File {idx}/{total_files}: {sample['path']}\n```{sample['extension'][1:]}\n{sample['content']}\n```"
+            )
+        code_context = ''.join(context_parts)
+
+        # 모드별 고정 부분은 __init__에서 미리 만들어 둔 header/footer를 재사용
+        return (
+            f"{self._prompt_header}"
+            f"**분석 대상**: 선정된 주요 파일 총 {total_files}개 중 {first_index}-{last_index}번 파일 "
+            f"({len(code_samples)}개) 제공\n\n"
+            f"## 📁 코드 샘플\n{code_context}"
+            f"{self._prompt_footer}"
+        )
 
     def _parse_ai_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -441,65 +864,33 @@ class AIAnalyzer:
                 'mode': self.mode,
                 'raw_response': response_text,
                 'issues': [],
-                'summary': {
-                    'total_issues': 0,
-                    'by_severity': {'critical': 0, 'warning': 0, 'info': 0}
-                }
+                'summary': _empty_summary()
             }
 
         # 응답 전체를 로그에 기록 (디버깅용)
         logger.debug("AI response length: %d characters", len(response_text))
         logger.debug("AI response preview (first 500 chars): %s", response_text[:500])
 
-        lines = response_text.split('\n')
-        
-        for line in lines:
+        for line in response_text.splitlines():
             line = line.strip()
             if not line:
                 continue
 
-            # 다양한 심각도 마커 패턴 인식
-            severity_patterns = {
-                'critical': [
-                    r'\*\*\[?Critical\]?',
-                    r'\*\*Critical',
-                    r'Critical:',
-                    r'🔴',
-                    r'\[Critical\]',
-                    r'CRITICAL',
-                    r'치명적',
-                    r'긴급'
-                ],
-                'warning': [
-                    r'\*\*\[?Warning\]?',
-                    r'\*\*Warning',
-                    r'Warning:',
-                    r'🟡',
-                    r'\[Warning\]',
-                    r'WARNING',
-                    r'경고'
-                ],
-                'info': [
-                    r'\*\*\[?Info\]?',
-                    r'\*\*Info',
-                    r'Info:',
-                    r'🟢',
-                    r'\[Info\]',
-                    r'INFO',
-                    r'정보',
-                    r'제안'
-                ]
-            }
-
-            # 심각도 감지
+            # 표준 헤더 형식(**[Critical] 제목**)은 한 번의 match로 심각도와 제목 추출
             detected_severity = None
-            for severity, patterns in severity_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        detected_severity = severity
-                        break
-                if detected_severity:
-                    break
+            title = ''
+            header = ISSUE_HEADER_PATTERN.match(line)
+            if header:
+                detected_severity = header.group(1).lower()
+                title = header.group(2)
+            elif not line.startswith(DETAIL_FIELD_PREFIXES):
+                # 그 외 형식은 심각도 마커 검색 (줄에서 가장 먼저 나오는 마커의 심각도 사용)
+                # 응답 형식의 상세 항목 줄(- 설명: 등)은 정규식 검색 없이 바로 상세 정보로 처리
+                marker = SEVERITY_PATTERN.search(line)
+                if marker:
+                    detected_severity = marker.lastgroup
+                    # 제목 추출 (심각도 마커 제거)
+                    title = SEVERITY_MARKERS[detected_severity].sub('', line)
 
             if detected_severity:
                 current_severity = detected_severity
@@ -508,10 +899,6 @@ class AIAnalyzer:
                     issues.append(current_issue)
                 
                 # 새 이슈 시작
-                # 제목 추출 (심각도 마커 제거)
-                title = line
-                for pattern in severity_patterns[detected_severity]:
-                    title = re.sub(pattern, '', title, flags=re.IGNORECASE)
                 title = title.strip('*:[] ').strip()
                 
                 if not title:
@@ -525,47 +912,37 @@ class AIAnalyzer:
                 }
                 logger.debug("Found %s issue: %s", detected_severity, title)
                 
-            elif line.startswith('-') or line.startswith('•') or line.startswith('*'):
+            elif line[0] in DETAIL_BULLETS:
                 # 상세 정보 추가
                 detail = line.lstrip('-•* ').strip()
-                # current_issue가 딕셔너리인지 확인
-                if current_issue and isinstance(current_issue, dict) and detail:
-                    # details 키가 항상 리스트가 되도록 방어적 처리
-                    details_list = current_issue.get('details')
-                    if isinstance(details_list, list):
-                        details_list.append(detail)
-                    else:
-                        # pylint가 item assignment를 싫어하므로 update로 대체
-                        current_issue.update({'details': [detail]})
-                elif not current_issue:
+                if current_issue is not None:
+                    # 이슈 생성 시 details는 항상 리스트로 초기화됨
+                    if detail:
+                        current_issue['details'].append(detail)
+                else:
                     # 이슈 없이 상세 정보가 나온 경우, 기본 이슈 생성
                     current_issue = {
                         'severity': current_severity,
                         'title': '분석 결과',
                         'details': [detail]
                     }
-            elif current_issue and isinstance(current_issue, dict):
-                # 일반 텍스트를 상세 정보로 추가 (빈 줄이 아닌 경우)
-                # current_issue가 딕셔너리인지 확인 후 접근
-                if line and not line.startswith('#'):
-                    details_list = current_issue.get('details')
-                    if isinstance(details_list, list):
-                        details_list.append(line)
-                    else:
-                        # pylint가 item assignment를 싫어하므로 update로 대체
-                        current_issue.update({'details': [line]})
+            elif current_issue is not None:
+                # 일반 텍스트를 상세 정보로 추가 (제목 줄 제외)
+                if not line.startswith('#'):
+                    current_issue['details'].append(line)
 
         # 마지막 이슈 추가
         if current_issue:
             issues.append(current_issue)
 
+        summary = self._build_summary(issues)
+
         # 파싱 결과 로깅
         logger.info("Parsed %d issues from AI response", len(issues))
         if issues:
-            critical_count = sum(1 for i in issues if i['severity'] == 'critical')
-            warning_count = sum(1 for i in issues if i['severity'] == 'warning')
-            info_count = sum(1 for i in issues if i['severity'] == 'info')
-            logger.debug("Issue breakdown: %d critical, %d warning, %d info", critical_count, warning_count, info_count)
+            by_severity = summary['by_severity']
+            logger.debug("Issue breakdown: %d critical, %d warning, %d info",
+                         by_severity['critical'], by_severity['warning'], by_severity['info'])
         else:
             logger.warning("No issues parsed from AI response. Response might not match expected format.")
             logger.debug("Full response for debugging:\n%s", response_text)
@@ -574,16 +951,124 @@ class AIAnalyzer:
             'mode': self.mode,
             'raw_response': response_text,
             'issues': issues,
-            'summary': {
-                'total_issues': len(issues),
-                'by_severity': {
-                    'critical': sum(1 for i in issues if i['severity'] == 'critical'),
-                    'warning': sum(1 for i in issues if i['severity'] == 'warning'),
-                    'info': sum(1 for i in issues if i['severity'] == 'info')
-                }
-            }
+            'summary': summary
+        }
+
+    def _build_summary(self, issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the issue summary (total and per-severity counts).
+
+        Args:
+            issues: Parsed AI issues
+
+        Returns:
+            Summary dictionary
+        """
+        # 한 번의 순회로 심각도별 개수 집계
+        counts = Counter(i['severity'] for i in issues)
+        return {
+            'total_issues': len(issues),
+            'by_severity': {severity: counts[severity] for severity in SUMMARY_SEVERITIES}
+        }
+
+    def _error_result(self, message: str) -> Dict[str, Any]:
+        """
+        Build an analysis result that reports an error and no issues.
+
+        Args:
+            message: User-facing error message
+
+        Returns:
+            Error result dictionary
+        """
+        return {
+            'mode': self.mode,
+            'error': message,
+            'issues': [],
+            'summary': _empty_summary()
+        }
+
+    def _response_digest(self, prompt: str) -> str:
+        """
+        Build the response cache digest for one analysis prompt.
+
+        The digest covers the model, the analysis mode and the full prompt (which
+        embeds every sample's path and content), so any code change in a batch
+        or a model/mode switch misses the cache for that batch only.
+
+        Args:
+            prompt: Analysis prompt for a batch of code samples
+
+        Returns:
+            Digest string
+        """
+        payload = json.dumps([CLAUDE_MODEL, self.mode, prompt], ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load_responses(self) -> Dict[str, Dict[str, str]]:
+        """
+        이전 실행에서 저장한 배치별 응답을 불러옵니다 (캐시 미사용 시 빈 dict).
+
+        Returns:
+            프롬프트 digest -> {'timestamp', 'response'} (캐시 TTL이 지난 응답 제외)
+        """
+        if not self.cache_manager:
+            return {}
+        cached = self.cache_manager.get_cached_result(RESPONSE_CACHE_KEY.format(mode=self.mode))
+        if not cached:
+            return {}
+
+        # 항목은 저장할 때마다 갱신되므로 응답마다 받은 시각으로 TTL 확인
+        cutoff = datetime.now() - self.cache_manager.cache_ttl
+        return {
+            digest: entry for digest, entry in cached['responses'].items()
+            if datetime.fromisoformat(entry['timestamp']) >= cutoff
         }
 
+    def _save_responses(self, responses: Dict[str, Dict[str, str]]) -> None:
+        """
+        이번 실행에서 쓴 배치별 응답을 한 번에 저장합니다 (실패는 로그만 남김).
+
+        Args:
+            responses: 프롬프트 digest -> {'timestamp', 'response'}
+        """
+        if not self.cache_manager:
+            return
+        try:
+            self.cache_manager.save_result(RESPONSE_CACHE_KEY.format(mode=self.mode), {'responses': responses})
+        except (IOError, OSError, UnicodeError) as e:
+            # 캐시 저장 실패는 분석 결과에 영향을 주지 않음
+            # UnicodeError: 디코딩할 수 없는 파일명(surrogate escape)이 응답에 포함되면 UTF-8로 저장 불가
+            logger.warning("Failed to cache AI analysis responses: %s", e)
+
+    def _request_review(self, prompt: str) -> str:
+        """
+        Send one analysis prompt to Claude and return the response text.
+
+        Args:
+            prompt: Analysis prompt for a batch of code samples
+
+        Returns:
+            Response text ('' if Claude returned no content)
+        """
+        message = self.client.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=4096,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            # 네트워크 환경과 프로젝트 규모를 고려해 타임아웃을 여유 있게 설정
+            # 기본값은 DEFAULT_CLAUDE_TIMEOUT (현재 180초)
+            timeout=DEFAULT_CLAUDE_TIMEOUT
+        )
+
+        if not message.content:
+            return ''
+        return message.content[0].text
+
     def analyze(self) -> Dict[str, Any]:
         """
         Perform AI-based code analysis.
@@ -599,49 +1084,80 @@ class AIAnalyzer:
 
             if not code_samples:
                 logger.warning("No code files found to analyze in %s", self.project_path)
-                return {
-                    'mode': self.mode,
-                    'error': 'No code files found to analyze',
-                    'issues': [],
-                    'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-                }
+                return self._error_result('No code files found to analyze')
 
             logger.info("Collected %d code samples for AI analysis", len(code_samples))
 
-            # Build prompt
-            prompt = self._build_analysis_prompt(code_samples)
-
-            # Call Claude API with timeout and retry logic
-            logger.info("Calling Claude API for code review...")
-            message = self.client.messages.create(
-                model=CLAUDE_MODEL,
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                # 네트워크 환경과 프로젝트 규모를 고려해 타임아웃을 여유 있게 설정
-                # 기본값은 DEFAULT_CLAUDE_TIMEOUT (현재 180초)
-                timeout=DEFAULT_CLAUDE_TIMEOUT
-            )
+            # Build one prompt per batch of the top MAX_PROMPT_FILES samples
+            # (각 프롬프트에는 전체 샘플 수와 배치의 파일 번호를 함께 표시)
+            prompt_samples = code_samples[:MAX_PROMPT_FILES]
+            prompts = [
+                self._build_analysis_prompt(prompt_samples[i:i + PROMPT_BATCH_SIZE], len(code_samples), i + 1)
+                for i in range(0, len(prompt_samples), PROMPT_BATCH_SIZE)
+            ]
+
+            # 같은 프롬프트(+모델/모드)의 응답은 캐시에서 재사용하고, 바뀐 배치만 API 호출
+            digests = [self._response_digest(prompt) for prompt in prompts]
+            stored = self._load_responses()
+            response_texts = [stored[digest]['response'] if digest in stored else '' for digest in digests]
+            pending = [index for index, digest in enumerate(digests) if digest not in stored]
+
+            api_errors = []
+            if pending:
+                # Call Claude API concurrently (one request per batch)
+                logger.info("Calling Claude API for code review (%d of %d request(s) not cached)...",
+                            len(pending), len(prompts))
+                with ThreadPoolExecutor(max_workers=min(len(pending), self.max_concurrent_requests)) as executor:
+                    futures = {index: executor.submit(self._request_review, prompts[index]) for index in pending}
+
+                for index, future in futures.items():
+                    try:
+                        response_texts[index] = future.result()
+                    except anthropic.APIError as e:
+                        api_errors.append(e)
+            else:
+                logger.info("Using cached AI analysis results")
+
+            # 이번 배치의 응답만 남겨 한 번에 저장 (이전 코드의 응답은 버림, 바뀐 것이 없으면 저장 생략)
+            responses = {digest: stored[digest] for digest in digests if digest in stored}
+            received_at = datetime.now().isoformat()
+            for index in pending:
+                if response_texts[index]:
+                    responses[digests[index]] = {'timestamp': received_at, 'response': response_texts[index]}
+            if responses != stored:
+                self._save_responses(responses)
+
+            # 모든 요청이 실패한 경우에만 에러로 처리 (일부 실패 시 성공한 배치 결과 사용)
+            warning = None
+            if api_errors:
+                if len(api_errors) == len(prompts):
+                    raise api_errors[0]
+                logger.warning("%d of %d Claude API request(s) failed: %s",
+                               len(api_errors), len(prompts), api_errors[0])
+                warning = (f"{len(api_errors)} of {len(prompts)} AI review request(s) failed; "
+                           f"results cover only part of the sampled files ({_api_error_message(api_errors[0])})")
 
             # Extract response text
-            if not message.content or len(message.content) == 0:
+            response_texts = [text for text in response_texts if text]
+            if not response_texts:
                 logger.error("Claude API returned empty response")
-                return {
-                    'mode': self.mode,
-                    'error': 'Claude API returned empty response',
-                    'issues': [],
-                    'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-                }
-            
-            response_text = message.content[0].text
+                return self._error_result('Claude API returned empty response')
+
+            response_text = '\n\n'.join(response_texts)
             logger.info("Successfully received AI analysis response (%d characters)", len(response_text))
 
-            # Parse and return results
-            result = self._parse_ai_response(response_text)
+            # Parse each response and merge the issues
+            issues = []
+            for text in response_texts:
+                issues.extend(self._parse_ai_response(text)['issues'])
+            result = {
+                'mode': self.mode,
+                'raw_response': response_text,
+                'issues': issues,
+                'summary': self._build_summary(issues)
+            }
+            if warning:
+                result['warning'] = warning
             logger.info("AI analysis found %d issues", result['summary']['total_issues'])
             
             # 파싱된 이슈가 없으면 경고
@@ -649,47 +1165,14 @@ class AIAnalyzer:
                 logger.warning("AI analysis completed but no issues were parsed. "
                              "This might indicate a parsing issue or the code has no issues.")
                 logger.debug("Raw response for review:\n%s...", response_text[:1000])
-            
+
             return result
 
-        except anthropic.APIConnectionError as e:
-            logger.error("Claude API connection error: %s", e)
-            return {
-                'mode': self.mode,
-                'error': f'Failed to connect to Claude API: {str(e)}. Check your internet connection.',
-                'issues': [],
-                'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-            }
-        except anthropic.RateLimitError as e:
-            logger.error("Claude API rate limit exceeded: %s", e)
-            return {
-                'mode': self.mode,
-                'error': f'API rate limit exceeded: {str(e)}. Please try again later.',
-                'issues': [],
-                'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-            }
-        except anthropic.AuthenticationError as e:
-            logger.error("Claude API authentication error: %s", e)
-            return {
-                'mode': self.mode,
-                'error': f'Authentication failed: {str(e)}. Check your ANTHROPIC_API_KEY.',
-                'issues': [],
-                'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-            }
         except anthropic.APIError as e:
-            logger.error("Claude API error: %s", e, exc_info=True)
-            return {
-                'mode': self.mode,
-                'error': f'Claude API error: {str(e)}',
-                'issues': [],
-                'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-            }
+            message = _api_error_message(e)
+            logger.error("Claude API error (%s): %s", type(e).__name__, e)
+            return self._error_result(message)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # 예기치 못한 모든 예외에 대한 최후 방어선 (사용자에게는 명확한 에러 메시지 제공)
             logger.error("Unexpected error during AI analysis: %s", e, exc_info=True)
-            return {
-                'mode': self.mode,
-                'error': f'AI analysis failed: {str(e)}',
-                'issues': [],
-                'summary': {'total_issues': 0, 'by_severity': {'critical': 0, 'warning': 0, 'info': 0}}
-            }
+            return self._error_result(f'AI analysis failed: {str(e)}')
@@ -1,18 +1,277 @@
 """Static code analysis module using various linting and security tools."""
 
+import fnmatch
+import functools
+import hashlib
+import heapq
+import math
+import os
+import posixpath
+import re
+import signal
 import subprocess
+import threading
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
 import shutil
 
-from src.config.settings import STATIC_ANALYSIS_TOOLS
+try:
+    # orjson이 설치되어 있으면 도구 출력(JSON) 파싱에 사용 (표준 json보다 수 배 빠름)
+    # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 기존 예외 처리가 그대로 동작
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from src.config.settings import LANGUAGE_PATTERNS, SEMGREP_CONFIG, STATIC_ANALYSIS_TOOLS
 from src.utils.logger import setup_logger
 from src.utils.cache_manager import CacheManager
 
 # Module logger
 logger = setup_logger(__name__)
 
+# 동시에 실행할 외부 분석 도구 수 상한
+# 도구마다 여러 코어와 큰 메모리를 쓰므로 코어 수의 절반까지만 동시에 실행 (최소 2개)
+MAX_TOOL_WORKERS = max(2, (os.cpu_count() or 1) // 2)
+
+# 바뀐 파일만 다시 분석할 수 있는 도구 (파일 단위로 결과가 나뉘고 파일 목록을 인자로 받는 도구)
+# pylint는 다른 모듈을 보고 판단하는 검사(no-member, no-name-in-module, cyclic-import, duplicate-code)가
+# 있어 한 파일이 바뀌면 다른 파일의 결과도 달라지므로 제외 (.py 파일이 하나라도 바뀌면 전체를 다시 분석)
+INCREMENTAL_TOOLS = frozenset({'rubocop'})
+
+# 언어별 린터: (언어, 도구 이름, StaticAnalyzer 실행 메서드 이름)
+LANGUAGE_TOOL_RUNNERS: Tuple[Tuple[str, str, str], ...] = (
+    ('python', 'pylint', '_run_pylint'),
+    ('go', 'staticcheck', '_run_staticcheck'),
+    ('rust', 'clippy', '_run_clippy'),
+    ('php', 'phpstan', '_run_phpstan'),
+    ('ruby', 'rubocop', '_run_rubocop'),
+    ('kotlin', 'ktlint', '_run_ktlint'),
+    ('swift', 'swiftlint', '_run_swiftlint'),
+    ('csharp', 'roslyn', '_run_dotnet_build'),  # dotnet build (Roslyn analyzers)
+)
+
+# 도구별 설정/빌드 파일 이름 패턴 (프로젝트 어느 깊이에 있든 적용)
+# 바뀌면 소스가 그대로여도 캐시된 결과를 버림 (하위 디렉터리의 린터 설정, 프로젝트/잠금 파일 포함)
+TOOL_CONFIG_FILES: Dict[str, Tuple[str, ...]] = {
+    'pylint': ('.pylintrc', 'pylintrc', 'pyproject.toml', 'setup.cfg', 'setup.py', 'tox.ini'),
+    'staticcheck': ('staticcheck.conf', 'go.mod', 'go.sum', 'go.work', 'go.work.sum'),
+    'clippy': ('clippy.toml', '.clippy.toml', 'Cargo.toml', 'Cargo.lock', 'rust-toolchain', 'rust-toolchain.toml'),
+    'phpstan': ('phpstan.neon', 'phpstan.neon.dist', 'phpstan.dist.neon', 'composer.json', 'composer.lock'),
+    'rubocop': ('.rubocop.yml', '.rubocop_todo.yml', 'Gemfile', 'Gemfile.lock', '*.gemspec'),
+    'ktlint': ('.editorconfig', '*.gradle', '*.gradle.kts'),
+    'swiftlint': ('.swiftlint.yml', 'Package.swift', 'Package.resolved'),
+    'roslyn': (
+        '.editorconfig', '.globalconfig', 'global.json', 'nuget.config', 'packages.lock.json',
+        '*.csproj', '*.sln', '*.props', '*.targets', '*.ruleset'
+    ),
+    'semgrep': ('.semgrepignore',),
+    'jscpd': ('.jscpd.json',),
+}
+
+# TOOL_CONFIG_FILES를 도구별 정규식 하나로 합친 것 (파일 이름 비교, 대소문자 무시: NuGet.Config 등)
+TOOL_CONFIG_PATTERNS: Dict[str, re.Pattern] = {
+    tool: re.compile('|'.join(fnmatch.translate(name) for name in names), re.IGNORECASE)
+    for tool, names in TOOL_CONFIG_FILES.items()
+}
+
+# pylint를 나눠 실행할 때 동시에 띄우는 프로세스 수
+PYLINT_JOBS = max(1, (os.cpu_count() or 1) // 2)
+
+# pylint 프로세스 하나에 넘기는 최대 파일 수 (명령줄 길이 제한 방지)
+PYLINT_MAX_FILES_PER_RUN = 200
+
+# rubocop 프로세스 하나에 넘기는 최대 파일 수 (명령줄 길이 제한 방지)
+RUBOCOP_MAX_FILES_PER_RUN = 200
+
+# 파일 수집/도구 실행 시 어느 깊이에서든 건너뛸 디렉터리 (의존성, 가상환경, 도구 캐시, VCS)
+# build/env/target/vendor/obj 같은 이름은 실제 소스 패키지일 수 있고 staticcheck/clippy/dotnet이
+# 그대로 분석하므로, 캐시 검증에서 빠지지 않도록 여기에 넣지 않음
+SOURCE_SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'venv', '.venv', '__pycache__', '.pytest_cache', '.mypy_cache', '.tox'
+})
+
+# 이름 패턴으로 건너뛸 파일/디렉터리 (패키징 메타데이터, 바이트코드)
+SOURCE_SKIP_GLOBS = ('*.egg-info', '*.pyc')
+
+# SOURCE_SKIP_GLOBS를 하나의 정규식으로 합친 것 (항목마다 패턴을 하나씩 비교하지 않도록)
+SOURCE_SKIP_GLOB_PATTERN = re.compile(
+    '|'.join(fnmatch.translate(pattern) for pattern in SOURCE_SKIP_GLOBS) or r'(?!)'
+)
+
+# .sln/.csproj 탐색 시 건너뛸 디렉터리 (빌드 출력, 의존성, VCS)
+DOTNET_SKIP_DIRS = frozenset({'bin', 'obj', 'node_modules', '.git'})
+
+# 도구별 심각도 -> 공통 심각도 (이슈마다 dict를 새로 만들지 않도록 모듈 수준에 정의)
+PYLINT_SEVERITY_MAP = {
+    'error': 'critical',
+    'fatal': 'critical',
+    'warning': 'warning',
+    'refactor': 'info',
+    'convention': 'info',
+    'info': 'info'
+}
+SEMGREP_SEVERITY_MAP = {
+    'ERROR': 'critical',
+    'WARNING': 'warning',
+    'INFO': 'info'
+}
+
+# MSBuild 진단 줄 형식: 파일(줄,열): warning|error 코드: 메시지
+# 예: Program.cs(10,5): warning CS0219: The variable 'x' is assigned but its value is never used
+# 위치가 없는 진단(예: CSC : error CS2001: ...)은 파일 'unknown', 줄 0으로 기록
+MSBUILD_DIAGNOSTIC_PATTERN = re.compile(
+    r'^\s*(?P<file>[^\r\n]*?)(?:\((?P<line>\d+)(?:,\d+)*\))?\s*:\s+'
+    r'(?P<severity>warning|error)\s+(?P<code>\w+)\s*:\s*(?P<message>[^\r\n]*?)\s*$',
+    re.MULTILINE
+)
+
+
+# 실행 중인 외부 도구 프로세스
+# 도구는 새 세션에서 실행되어 터미널의 Ctrl+C(SIGINT)를 받지 못하므로, 중단 시 직접 종료하기 위해 추적
+_active_processes: Set[subprocess.Popen] = set()
+_active_processes_lock = threading.Lock()
+
+# 분석 중단 신호: 설정되면 _run_tool이 새 도구를 시작하지 않음
+# (pylint 묶음, rubocop 배치처럼 작업 스레드가 이어서 실행하는 도구도 Ctrl+C 후 바로 멈추도록)
+_cancel_event = threading.Event()
+
+
+@functools.lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    """
+    실행 파일 경로를 찾습니다 (PATH 탐색 결과를 프로세스 동안 재사용).
+
+    Args:
+        command: 실행 파일 이름
+
+    Returns:
+        실행 파일 경로, 없으면 None
+    """
+    return shutil.which(command)
+
+
+def _run_tool(args: List[str], timeout: float, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+    """
+    외부 분석 도구를 실행하고 stdout/stderr를 바이트로 수집합니다.
+
+    출력 대부분은 JSON 파서에 그대로 넘기므로 텍스트로 디코딩하지 않습니다
+    (json.loads/orjson.loads 모두 bytes를 직접 파싱).
+
+    subprocess.run은 시간 초과 시 직접 실행한 프로세스만 종료하므로,
+    semgrep/cargo/dotnet이 띄운 하위 프로세스가 남지 않도록 새 세션(프로세스 그룹)에서
+    실행하고 시간 초과 시 그룹 전체를 종료합니다. 새 세션의 도구에는 터미널 Ctrl+C가 전달되지 않으므로
+    KeyboardInterrupt 등으로 중단될 때도 그룹 전체를 종료한 뒤 예외를 다시 전달합니다.
+
+    Args:
+        args: 실행할 명령과 인자
+        timeout: 최대 실행 시간(초)
+        cwd: 작업 디렉터리 (없으면 현재 디렉터리)
+
+    Returns:
+        종료 코드와 출력(bytes)이 담긴 CompletedProcess
+
+    Raises:
+        subprocess.TimeoutExpired: timeout 안에 끝나지 않은 경우
+        KeyboardInterrupt: 분석이 중단되어(_cancel_event) 도구를 실행하지 않거나 종료한 경우
+    """
+    if _cancel_event.is_set():
+        raise KeyboardInterrupt("static analysis was cancelled")
+
+    with subprocess.Popen(
+        args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=os.name == 'posix'
+    ) as proc:
+        with _active_processes_lock:
+            _active_processes.add(proc)
+        try:
+            # 시작 직후 중단된 경우: _kill_active_tools가 목록을 읽은 뒤 등록되었을 수 있으므로 다시 확인
+            if _cancel_event.is_set():
+                raise KeyboardInterrupt("static analysis was cancelled")
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_tree(proc)
+            proc.communicate()
+            raise
+        except BaseException:
+            # KeyboardInterrupt 등으로 중단되면 도구 프로세스 그룹을 남기지 않고 종료한 뒤 다시 전달
+            _kill_process_tree(proc)
+            raise
+        finally:
+            with _active_processes_lock:
+                _active_processes.discard(proc)
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """
+    도구 프로세스와 그 하위 프로세스를 종료합니다.
+
+    Args:
+        proc: _run_tool로 실행한 프로세스 (POSIX에서는 프로세스 그룹 리더)
+    """
+    if os.name == 'posix':
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            # 이미 모두 종료된 경우
+            pass
+    else:
+        proc.kill()
+
+
+def _kill_active_tools() -> None:
+    """
+    분석을 중단하고 실행 중인 모든 외부 도구를 종료합니다.
+
+    Ctrl+C는 메인 스레드에만 전달되므로, 작업 스레드에서 기다리는 도구는 이 함수로 종료합니다.
+    중단 신호를 먼저 설정해 작업 스레드가 다음 도구를 새로 시작하지 않도록 합니다.
+    """
+    _cancel_event.set()
+    with _active_processes_lock:
+        processes = list(_active_processes)
+    for proc in processes:
+        _kill_process_tree(proc)
+
+
+def _split_by_size(paths: List[str], base: Path, shard_count: int) -> List[List[str]]:
+    """
+    파일을 크기 합이 비슷한 묶음으로 나눕니다 (큰 파일부터 가장 가벼운 묶음에 배치).
+
+    Args:
+        paths: base 기준 상대 경로 목록
+        base: 경로의 기준 디렉터리
+        shard_count: 묶음 수 (len(paths) / PYLINT_MAX_FILES_PER_RUN 이상이어야 함)
+
+    Returns:
+        비어 있지 않은 묶음 목록 (묶음마다 최대 PYLINT_MAX_FILES_PER_RUN개 파일)
+    """
+    sizes: Dict[str, int] = {}
+    for path in paths:
+        try:
+            sizes[path] = os.path.getsize(base / path)
+        except OSError:
+            sizes[path] = 0
+
+    # (크기 합, 묶음 번호, 파일 목록) min-heap: 항상 가장 가벼운 묶음에 다음 파일을 추가
+    open_shards = [(0, index, []) for index in range(shard_count)]
+    full_shards = []
+    for path in sorted(paths, key=sizes.__getitem__, reverse=True):
+        total, index, shard = heapq.heappop(open_shards)
+        shard.append(path)
+        if len(shard) >= PYLINT_MAX_FILES_PER_RUN:
+            full_shards.append((total, index, shard))
+        else:
+            heapq.heappush(open_shards, (total + sizes[path], index, shard))
+
+    return [shard for _, _, shard in sorted(open_shards + full_shards, key=lambda s: s[1]) if shard]
+
 
 class StaticAnalyzer:
     """Runs static analysis tools based on detected languages."""
@@ -28,10 +287,14 @@ class StaticAnalyzer:
             use_cache: Whether to use result caching
         """
         self.project_path = project_path
-        self.languages = languages
+        # 도구 실행 여부 판단은 frozenset으로 (O(1) 조회), 결과에는 감지 순서를 유지한 목록을 기록
+        self.languages = frozenset(languages)
+        self.language_list = list(languages)
         self.mode = mode
         self.use_cache = use_cache
         self.cache_manager = CacheManager(project_path) if use_cache else None
+        # 프로젝트 상대 경로 -> 파일 내용 해시 (도구 간 공유, 파일마다 한 번만 계산)
+        self._file_hashes: Dict[str, str] = {}
         self.results = {
             'pylint': [],
             'eslint': [],
@@ -54,14 +317,20 @@ class StaticAnalyzer:
             return False
 
         command = tool_config['command']
-        return shutil.which(command) is not None
+        return _which(command) is not None
 
-    def _run_pylint(self) -> List[Dict[str, Any]]:
+    def _run_pylint(self, targets: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Run Pylint analysis on Python files.
 
+        Args:
+            targets: 분석할 파일의 프로젝트 기준 상대 경로 (None이면 프로젝트 전체)
+                     여러 파일이면 묶음으로 나눠 여러 pylint 프로세스로 동시에 분석
+                     (모듈 간 검사는 같은 묶음의 파일끼리만 비교됨)
+
         Returns:
             List of issues found by Pylint
+            (묶음 실행이 실패하면 실행 상태 안내의 failed_files에 그 묶음의 파일 목록을 기록)
         """
         if 'python' not in self.languages:
             return []
@@ -74,21 +343,61 @@ class StaticAnalyzer:
                 'suggestion': STATIC_ANALYSIS_TOOLS['pylint']['install_hint']
             }]
 
+        # 파일 목록이 없으면 프로젝트 전체를 pylint 자체 병렬 실행(--jobs)으로 분석
+        # pylint가 작업 프로세스의 결과를 합치므로 duplicate-code(R0801) 같은 모듈 간 검사도 프로젝트 전체 기준
+        if not targets:
+            return self._run_pylint_shard(['.'], jobs=PYLINT_JOBS)
+
+        # pylint는 프로세스당 단일 스레드이므로 파일 크기 합이 비슷한 묶음으로 나눠 동시에 실행
+        shard_count = max(min(PYLINT_JOBS, len(targets)), math.ceil(len(targets) / PYLINT_MAX_FILES_PER_RUN))
+        shards = _split_by_size(targets, self.project_path, shard_count)
+        if len(shards) == 1:
+            return self._run_pylint_shard(shards[0])
+
+        logger.info("Running Pylint on %d files in %d shards", len(targets), len(shards))
+        issues: List[Dict[str, Any]] = []
+        # 안내 메시지 -> 실행 상태 안내 (시간 초과 등은 묶음마다 반복되지 않도록 한 번만 추가)
+        statuses: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(len(shards), PYLINT_JOBS)) as executor:
+            for shard, shard_issues in zip(shards, executor.map(self._run_pylint_shard, shards)):
+                for issue in shard_issues:
+                    if 'file' in issue:
+                        issues.append(issue)
+                    else:
+                        # 실패한 묶음의 파일만 기록해, 성공한 묶음의 결과는 그대로 쓰고 실패한 파일만 다음에 다시 분석
+                        status = statuses.setdefault(issue['message'], {**issue, 'failed_files': []})
+                        status['failed_files'].extend(shard)
+        return issues + list(statuses.values())
+
+    def _run_pylint_shard(self, targets: List[str], jobs: int = 1) -> List[Dict[str, Any]]:
+        """
+        pylint 프로세스 하나로 주어진 경로를 분석합니다.
+
+        Args:
+            targets: 분석할 프로젝트 기준 상대 경로 목록
+            jobs: pylint 내부 작업 프로세스 수 (묶음으로 나눠 실행할 때는 1)
+
+        Returns:
+            List of issues found by Pylint
+        """
         try:
-            logger.info("Running Pylint on %s", self.project_path)
+            logger.info("Running Pylint on %d path(s) in %s", len(targets), self.project_path)
 
             # Run pylint with JSON output and improved error handling
-            result = subprocess.run(
-                ['pylint', str(self.project_path), '--output-format=json', '--recursive=y'],
-                capture_output=True,
-                text=True,
-                timeout=300,  # Increased timeout to 5 minutes
-                check=False  # Don't raise on non-zero exit code
+            # 프로젝트 디렉터리에서 실행해 결과 경로를 프로젝트 기준 상대 경로로 맞춤
+            result = _run_tool(
+                [
+                    'pylint', *targets, '--output-format=json', '--recursive=y', f'--jobs={jobs}',
+                    # 디렉터리를 순회할 때 의존성/가상환경/빌드 디렉터리는 건너뜀
+                    f"--ignore={','.join(sorted(SOURCE_SKIP_DIRS))}"
+                ],
+                cwd=str(self.project_path),
+                timeout=300  # Increased timeout to 5 minutes
             )
 
             if result.stdout:
                 try:
-                    pylint_output = json.loads(result.stdout)
+                    pylint_output = _json_loads(result.stdout)
                     issues = []
 
                     for item in pylint_output:
@@ -158,18 +467,21 @@ class StaticAnalyzer:
         try:
             logger.info("Running Semgrep security scan on %s", self.project_path)
 
-            # Run semgrep with auto config and improved error handling
-            result = subprocess.run(
-                ['semgrep', 'scan', '--config=auto', '--json', str(self.project_path)],
-                capture_output=True,
-                text=True,
-                timeout=300,  # Increased timeout for large projects
-                check=False
+            # Run semgrep with configured rules and improved error handling
+            # auto 설정은 메트릭 전송이 켜져 있어야 동작하므로, 규칙을 고정한 경우에만 메트릭을 끔
+            metrics_args = [] if SEMGREP_CONFIG == 'auto' else ['--metrics=off']
+            result = _run_tool(
+                [
+                    'semgrep', 'scan', f'--config={SEMGREP_CONFIG}', *metrics_args, '--json',
+                    *(f'--exclude={name}' for name in sorted(SOURCE_SKIP_DIRS)),
+                    str(self.project_path)
+                ],
+                timeout=300  # Increased timeout for large projects
             )
 
             if result.stdout:
                 try:
-                    semgrep_output = json.loads(result.stdout)
+                    semgrep_output = _json_loads(result.stdout)
                     issues = []
 
                     for finding in semgrep_output.get('results', []):
@@ -238,17 +550,17 @@ class StaticAnalyzer:
             logger.info("Running jscpd code duplication detection on %s", self.project_path)
 
             # Run jscpd with JSON output and improved error handling
-            result = subprocess.run(
-                ['jscpd', str(self.project_path), '--format', 'json', '--silent'],
-                capture_output=True,
-                text=True,
-                timeout=180,
-                check=False
+            result = _run_tool(
+                [
+                    'jscpd', str(self.project_path), '--format', 'json', '--silent',
+                    '--ignore', ','.join(f'**/{name}/**' for name in sorted(SOURCE_SKIP_DIRS))
+                ],
+                timeout=180
             )
 
             if result.stdout:
                 try:
-                    jscpd_output = json.loads(result.stdout)
+                    jscpd_output = _json_loads(result.stdout)
                     duplicates = jscpd_output.get('duplicates', [])
 
                     if duplicates:
@@ -302,6 +614,9 @@ class StaticAnalyzer:
         Returns:
             List of issues found by staticcheck
         """
+        if 'go' not in self.languages:
+            return []
+
         if not self._check_tool_installed('staticcheck'):
             return [{
                 'tool': 'staticcheck',
@@ -313,21 +628,18 @@ class StaticAnalyzer:
         try:
             logger.info("Running staticcheck on Go code in %s", self.project_path)
 
-            result = subprocess.run(
+            result = _run_tool(
                 ['staticcheck', '-f', 'json', './...'],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
+                timeout=300
             )
 
             if result.stdout:
                 try:
                     issues = []
-                    for line in result.stdout.strip().split('\n'):
+                    for line in result.stdout.splitlines():
                         if line:
-                            item = json.loads(line)
+                            item = _json_loads(line)
                             issues.append({
                                 'tool': 'staticcheck',
                                 'file': item.get('location', {}).get('file', 'unknown'),
@@ -361,7 +673,10 @@ class StaticAnalyzer:
         Returns:
             List of issues found by clippy
         """
-        if not self._check_tool_installed('cargo'):
+        if 'rust' not in self.languages:
+            return []
+
+        if not self._check_tool_installed('clippy'):
             return [{
                 'tool': 'clippy',
                 'severity': 'info',
@@ -372,22 +687,19 @@ class StaticAnalyzer:
         try:
             logger.info("Running cargo clippy on Rust code in %s", self.project_path)
 
-            result = subprocess.run(
+            result = _run_tool(
                 ['cargo', 'clippy', '--message-format=json', '--', '-D', 'warnings'],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
+                timeout=300
             )
 
             if result.stdout:
                 try:
                     issues = []
-                    for line in result.stdout.strip().split('\n'):
+                    for line in result.stdout.splitlines():
                         if line:
                             try:
-                                item = json.loads(line)
+                                item = _json_loads(line)
                                 if item.get('reason') == 'compiler-message':
                                     message = item.get('message', {})
                                     spans = message.get('spans', [])
@@ -429,6 +741,9 @@ class StaticAnalyzer:
         Returns:
             List of issues found by PHPStan
         """
+        if 'php' not in self.languages:
+            return []
+
         if not self._check_tool_installed('phpstan'):
             return [{
                 'tool': 'phpstan',
@@ -440,18 +755,15 @@ class StaticAnalyzer:
         try:
             logger.info("Running PHPStan on PHP code in %s", self.project_path)
 
-            result = subprocess.run(
+            result = _run_tool(
                 ['phpstan', 'analyse', '--error-format=json', '.'],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
+                timeout=300
             )
 
             if result.stdout:
                 try:
-                    data = json.loads(result.stdout)
+                    data = _json_loads(result.stdout)
                     issues = []
 
                     for file, file_errors in data.get('files', {}).items():
@@ -481,13 +793,19 @@ class StaticAnalyzer:
 
         return []
 
-    def _run_rubocop(self) -> List[Dict[str, Any]]:
+    def _run_rubocop(self, targets: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Run RuboCop for Ruby code analysis.
 
+        Args:
+            targets: 분석할 파일의 프로젝트 기준 상대 경로 (None이면 프로젝트 전체)
+
         Returns:
             List of issues found by RuboCop
         """
+        if 'ruby' not in self.languages:
+            return []
+
         if not self._check_tool_installed('rubocop'):
             return [{
                 'tool': 'rubocop',
@@ -499,37 +817,57 @@ class StaticAnalyzer:
         try:
             logger.info("Running RuboCop on Ruby code in %s", self.project_path)
 
-            result = subprocess.run(
-                ['rubocop', '--format', 'json', '.'],
-                cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
-            )
-
-            if result.stdout:
+            # 파일 목록을 받으면 rubocop이 프로젝트를 다시 탐색하지 않도록 그대로 전달
+            # (--force-exclusion: 명시한 파일에도 설정의 Exclude 규칙 적용)
+            if targets:
+                batches = [
+                    targets[start:start + RUBOCOP_MAX_FILES_PER_RUN]
+                    for start in range(0, len(targets), RUBOCOP_MAX_FILES_PER_RUN)
+                ]
+            else:
+                batches = [['.']]
+            exclusion_args = ['--force-exclusion'] if targets else []
+
+            file_results: List[Dict[str, Any]] = []
+            parse_failure: Optional[Dict[str, Any]] = None
+            for batch in batches:
+                result = _run_tool(
+                    # --parallel: 검사 대상 파일을 CPU 코어 수만큼의 작업 프로세스로 나눠 검사
+                    ['rubocop', '--format', 'json', '--parallel', *exclusion_args, *batch],
+                    cwd=str(self.project_path),
+                    timeout=300
+                )
                 try:
-                    data = json.loads(result.stdout)
-                    issues = []
-
-                    for file_data in data.get('files', []):
-                        for offense in file_data.get('offenses', []):
-                            severity = 'warning' if offense.get('severity') in ['error', 'warning'] else 'info'
-                            issues.append({
-                                'tool': 'rubocop',
-                                'file': file_data.get('path', 'unknown'),
-                                'line': offense.get('location', {}).get('line', 0),
-                                'severity': severity,
-                                'message': offense.get('message', ''),
-                                'cop_name': offense.get('cop_name', '')
-                            })
-
-                    logger.info("RuboCop found %d issues", len(issues))
-                    return issues
+                    file_results.extend(_json_loads(result.stdout).get('files', []))
+                except json.JSONDecodeError as e:
+                    # 출력이 없거나 깨진 경우: 검사하지 못한 파일을 문제 없음으로 기록하지 않도록 실패로 보고
+                    logger.error("Failed to parse RuboCop JSON output: %s", e)
+                    if parse_failure is None:
+                        parse_failure = {
+                            'tool': 'rubocop',
+                            'severity': 'warning',
+                            'message': 'RuboCop output parsing failed'
+                        }
+                        if targets:
+                            parse_failure['failed_files'] = []
+                    if targets:
+                        parse_failure['failed_files'].extend(batch)
 
-                except json.JSONDecodeError:
-                    return []
+            issues = []
+            for file_data in file_results:
+                for offense in file_data.get('offenses', []):
+                    severity = 'warning' if offense.get('severity') in ['error', 'warning'] else 'info'
+                    issues.append({
+                        'tool': 'rubocop',
+                        'file': file_data.get('path', 'unknown'),
+                        'line': offense.get('location', {}).get('line', 0),
+                        'severity': severity,
+                        'message': offense.get('message', ''),
+                        'cop_name': offense.get('cop_name', '')
+                    })
+
+            logger.info("RuboCop found %d issues", len(issues))
+            return issues + ([parse_failure] if parse_failure else [])
 
         except subprocess.TimeoutExpired:
             logger.warning("RuboCop timed out")
@@ -540,8 +878,6 @@ class StaticAnalyzer:
             logger.error("RuboCop failed: %s", e)
             return [{'tool': 'rubocop', 'severity': 'warning', 'message': f'Analysis failed: {str(e)}'}]
 
-        return []
-
     def _run_ktlint(self) -> List[Dict[str, Any]]:
         """
         Run ktlint for Kotlin code analysis.
@@ -549,6 +885,9 @@ class StaticAnalyzer:
         Returns:
             List of issues found by ktlint
         """
+        if 'kotlin' not in self.languages:
+            return []
+
         if not self._check_tool_installed('ktlint'):
             return [{
                 'tool': 'ktlint',
@@ -560,19 +899,16 @@ class StaticAnalyzer:
         try:
             logger.info("Running ktlint on Kotlin code in %s", self.project_path)
 
-            result = subprocess.run(
+            result = _run_tool(
                 ['ktlint', '--reporter=json', '**/*.kt'],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
+                timeout=300
             )
 
             if result.stdout:
                 try:
                     # ktlint JSON format is array of objects
-                    data = json.loads(result.stdout)
+                    data = _json_loads(result.stdout)
                     issues = []
 
                     for item in data:
@@ -610,6 +946,9 @@ class StaticAnalyzer:
         Returns:
             List of issues found by SwiftLint
         """
+        if 'swift' not in self.languages:
+            return []
+
         if not self._check_tool_installed('swiftlint'):
             return [{
                 'tool': 'swiftlint',
@@ -621,18 +960,15 @@ class StaticAnalyzer:
         try:
             logger.info("Running SwiftLint on Swift code in %s", self.project_path)
 
-            result = subprocess.run(
+            result = _run_tool(
                 ['swiftlint', 'lint', '--reporter', 'json'],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
+                timeout=300
             )
 
             if result.stdout:
                 try:
-                    data = json.loads(result.stdout)
+                    data = _json_loads(result.stdout)
                     issues = []
 
                     for item in data:
@@ -666,6 +1002,26 @@ class StaticAnalyzer:
 
         return []
 
+    def _find_build_target(self) -> Optional[Path]:
+        """
+        dotnet build 대상 파일을 한 번의 디렉터리 순회로 찾습니다.
+
+        .sln 파일을 찾으면 바로 반환하고, 없으면 처음 찾은 .csproj 파일을 반환합니다.
+        빌드 출력(bin/obj)과 의존성 디렉터리는 순회하지 않습니다.
+
+        Returns:
+            빌드 대상 경로, 둘 다 없으면 None
+        """
+        first_csproj = None
+        for root, dirs, files in os.walk(self.project_path):
+            dirs[:] = [d for d in dirs if d not in DOTNET_SKIP_DIRS]
+            for name in files:
+                if name.endswith('.sln'):
+                    return Path(root) / name
+                if first_csproj is None and name.endswith('.csproj'):
+                    first_csproj = Path(root) / name
+        return first_csproj
+
     def _run_dotnet_build(self) -> List[Dict[str, Any]]:
         """
         Run dotnet build for C# code analysis (using Roslyn analyzers).
@@ -673,7 +1029,10 @@ class StaticAnalyzer:
         Returns:
             List of issues found by Roslyn analyzers
         """
-        if not self._check_tool_installed('dotnet'):
+        if 'csharp' not in self.languages:
+            return []
+
+        if not self._check_tool_installed('roslyn'):
             return [{
                 'tool': 'roslyn',
                 'severity': 'info',
@@ -685,10 +1044,9 @@ class StaticAnalyzer:
             logger.info("Running dotnet build on C# code in %s", self.project_path)
 
             # First, try to find .csproj or .sln files
-            csproj_files = list(self.project_path.rglob('*.csproj'))
-            sln_files = list(self.project_path.rglob('*.sln'))
+            target = self._find_build_target()
 
-            if not csproj_files and not sln_files:
+            if target is None:
                 return [{
                     'tool': 'roslyn',
                     'severity': 'info',
@@ -696,48 +1054,30 @@ class StaticAnalyzer:
                 }]
 
             # Run dotnet build with diagnostic output
-            target = str(sln_files[0]) if sln_files else str(csproj_files[0])
-
-            result = subprocess.run(
-                ['dotnet', 'build', target, '/p:TreatWarningsAsErrors=false'],
+            # quiet 출력은 경고/오류 줄만 남기고, NoSummary는 빌드 끝의 중복 진단 목록을 생략
+            result = _run_tool(
+                [
+                    'dotnet', 'build', str(target), '/p:TreatWarningsAsErrors=false',
+                    '-verbosity:quiet', '-consoleLoggerParameters:NoSummary'
+                ],
                 cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
+                timeout=300
             )
 
             issues = []
             # Parse build output for warnings and errors
-            for line in result.stdout.split('\n') + result.stderr.split('\n'):
-                # Look for standard MSBuild diagnostic format
-                # Example: Program.cs(10,5): warning CS0219: The variable 'x' is assigned but its value is never used
-                if ': warning ' in line or ': error ' in line:
-                    parts = line.split(': ')
-                    if len(parts) >= 3:
-                        location = parts[0].strip()
-                        severity_type = parts[1].strip()
-                        message = ': '.join(parts[2:]).strip()
-
-                        # Extract file and line number
-                        file_path = 'unknown'
-                        line_num = 0
-                        if '(' in location:
-                            file_path = location.split('(')[0]
-                            try:
-                                line_num = int(location.split('(')[1].split(',')[0])
-                            except ValueError:
-                                # 줄 번호 파싱 실패 시 0으로 유지
-                                line_num = 0
-
-                        severity = 'critical' if 'error' in severity_type else 'warning'
-                        issues.append({
-                            'tool': 'roslyn',
-                            'file': file_path,
-                            'line': line_num,
-                            'severity': severity,
-                            'message': message
-                        })
+            # 진단 줄은 문자열 처리가 필요하므로 이 도구만 텍스트로 디코딩
+            output = (result.stdout + b'\n' + result.stderr).decode('utf-8', errors='replace')
+            for match in MSBUILD_DIAGNOSTIC_PATTERN.finditer(output):
+                line_num = match.group('line')
+                issues.append({
+                    'tool': 'roslyn',
+                    'file': match.group('file') if line_num else 'unknown',
+                    'line': int(line_num) if line_num else 0,
+                    'code': match.group('code'),
+                    'severity': 'critical' if match.group('severity') == 'error' else 'warning',
+                    'message': match.group('message')
+                })
 
             logger.info("Roslyn analyzers found %d issues", len(issues))
             return issues
@@ -755,101 +1095,317 @@ class StaticAnalyzer:
 
     def _map_pylint_severity(self, pylint_type: str) -> str:
         """Map Pylint message type to our severity levels."""
-        severity_map = {
-            'error': 'critical',
-            'fatal': 'critical',
-            'warning': 'warning',
-            'refactor': 'info',
-            'convention': 'info',
-            'info': 'info'
-        }
-        return severity_map.get(pylint_type.lower(), 'info')
+        return PYLINT_SEVERITY_MAP.get(pylint_type.lower(), 'info')
 
     def _map_semgrep_severity(self, semgrep_severity: str) -> str:
         """Map Semgrep severity to our severity levels."""
-        severity_map = {
-            'ERROR': 'critical',
-            'WARNING': 'warning',
-            'INFO': 'info'
-        }
-        return severity_map.get(semgrep_severity.upper(), 'info')
+        return SEMGREP_SEVERITY_MAP.get(semgrep_severity.upper(), 'info')
 
-    def analyze(self) -> Dict[str, Any]:
+    def _collect_project_files(self) -> List[str]:
         """
-        Run all applicable static analysis tools (with caching support).
+        캐시 검증과 도구 입력에 사용할 프로젝트 파일 목록을 수집합니다.
+
+        의존성/가상환경/도구 캐시 디렉터리(SOURCE_SKIP_DIRS)는 순회하지 않으며,
+        캐시 파일 자체는 저장할 때마다 바뀌므로 캐시 디렉터리도 제외합니다.
 
         Returns:
-            Dictionary containing analysis results from all tools
+            프로젝트 내 파일 경로 목록 (파일이 많을 수 있어 Path 객체 대신 문자열 경로)
         """
-        # Check cache first
-        cache_key = f"static_analysis_{self.mode}"
+        skip_dirs = SOURCE_SKIP_DIRS
+        if self.cache_manager:
+            skip_dirs = skip_dirs | {self.cache_manager.cache_dir.name}
+
+        # os.scandir 스택으로 순회: DirEntry가 가진 파일 종류 정보를 쓰므로 항목마다 stat 호출 없음
+        files: List[str] = []
+        stack = [str(self.project_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if SOURCE_SKIP_GLOB_PATTERN.match(entry.name):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            files.append(entry.path)
+            except OSError as e:
+                logger.debug("Failed to scan %s: %s", directory, e)
+        return files
+
+    def _tool_dependency_files(self, tool: str, project_files: List[str]) -> List[str]:
+        """
+        소스 외에 도구 결과에 영향을 주는 파일(설정/빌드 파일, 도구 실행 파일)을 찾습니다.
 
-        if self.use_cache and self.cache_manager:
-            # Collect all code files for cache validation
-            project_files = list(self.project_path.rglob('*'))
-            project_files = [f for f in project_files if f.is_file()]
+        설정/빌드 파일은 루트뿐 아니라 하위 디렉터리에 있는 것도 포함합니다 (TOOL_CONFIG_FILES).
+        실행 파일은 도구를 다시 설치/업그레이드하면 수정 시각이 바뀌므로 버전 변경 감지에 사용합니다.
 
-            cached_result = self.cache_manager.get_cached_result(cache_key, project_files)
-            if cached_result:
-                logger.info("Using cached static analysis results")
-                return cached_result
+        Args:
+            tool: 도구 이름
+            project_files: 프로젝트 파일 목록 (_collect_project_files 결과)
 
-        logger.info("Running static analysis (no cache)")
+        Returns:
+            설정/빌드 파일과 도구 실행 파일 경로 목록
+        """
+        pattern = TOOL_CONFIG_PATTERNS.get(tool)
+        files = [path for path in project_files if pattern.match(os.path.basename(path))] if pattern else []
+        tool_config = STATIC_ANALYSIS_TOOLS.get(tool)
+        executable = _which(tool_config['command']) if tool_config else None
+        if executable:
+            files.append(executable)
+        return files
+
+    def _tool_fingerprint(self, dependency_files: List[str]) -> str:
+        """
+        도구 설정/버전 상태를 나타내는 지문을 계산합니다 (파일 경로, 수정 시각, 크기 기준).
 
-        results = {
-            'mode': self.mode,
-            'languages': self.languages,
-            'issues': []
+        Args:
+            dependency_files: _tool_dependency_files로 찾은 파일 목록
+
+        Returns:
+            지문 문자열
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for file_path in dependency_files:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            digest.update(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}|".encode())
+        return digest.hexdigest()
+
+    def _get_file_hashes(self, files: List[str]) -> Dict[str, str]:
+        """
+        파일 내용 해시를 반환합니다. 같은 파일을 여러 도구가 분석해도 한 번만 읽습니다.
+
+        Args:
+            files: 프로젝트 파일 목록
+
+        Returns:
+            상대 경로 -> 내용 해시 (경로 순으로 정렬, 읽을 수 없는 파일 제외)
+        """
+        # 수집된 경로는 모두 프로젝트 경로로 시작하므로 앞부분을 잘라 상대 경로를 만듦
+        prefix_length = len(os.path.join(self.project_path, ''))
+        relative_paths = sorted(
+            (file_path[prefix_length:].replace(os.sep, '/'), file_path) for file_path in files
+        )
+
+        # 경로 순으로 정렬해 병합된 이슈 순서를 실행마다 동일하게 유지
+        file_hashes: Dict[str, str] = {}
+        for relative_path, file_path in relative_paths:
+            if relative_path not in self._file_hashes:
+                try:
+                    with open(file_path, 'rb') as f:
+                        self._file_hashes[relative_path] = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+                except OSError as e:
+                    logger.debug("Failed to hash %s: %s", file_path, e)
+                    continue
+            file_hashes[relative_path] = self._file_hashes[relative_path]
+        return file_hashes
+
+    def _plan_incremental_run(
+        self,
+        tool: str,
+        files: List[str],
+        dependency_files: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str], List[str], str]:
+        """
+        이전 실행의 파일별 결과와 내용 해시를 비교해 다시 분석할 파일을 정합니다.
+
+        도구 설정이나 버전이 바뀌었으면 이전 결과를 모두 버리고 전체 파일을 다시 분석합니다.
+
+        Args:
+            tool: 도구 이름
+            files: 도구가 분석하는 프로젝트 파일 목록
+            dependency_files: 도구 설정/빌드 파일과 실행 파일 목록
+
+        Returns:
+            (이전 파일별 결과, 현재 파일별 해시, 다시 분석할 상대 경로 목록, 도구 지문)
+        """
+        fingerprint = self._tool_fingerprint(dependency_files)
+        cached = self.cache_manager.get_cached_result(f"static_files_{tool}")
+        stored_files = cached['files'] if cached and cached.get('fingerprint') == fingerprint else {}
+
+        file_hashes = self._get_file_hashes(files)
+        changed = [
+            path for path, file_hash in file_hashes.items()
+            if stored_files.get(path, {}).get('hash') != file_hash
+        ]
+        logger.info("%s: re-analyzing %d of %d files", tool, len(changed), len(file_hashes))
+        return stored_files, file_hashes, changed, fingerprint
+
+    def _merge_incremental_run(
+        self,
+        tool: str,
+        plan: Tuple[Dict[str, Dict[str, Any]], Dict[str, str], List[str], str],
+        issues: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        다시 분석한 파일의 이슈와 바뀌지 않은 파일의 이전 이슈를 합치고 파일별 결과를 저장합니다.
+
+        파일 정보가 없는 실행 상태 안내(시간 초과, 파싱 실패 등)는 실패로 봅니다. 안내에 실패한 파일 목록
+        (failed_files)이 있으면 그 파일만, 없으면 이번에 분석한 파일 전체가 실패한 것으로 처리합니다.
+        실패한 파일은 이전 결과와 이전 해시를 그대로 두어 다음 실행에서 다시 분석합니다.
+
+        Args:
+            tool: 도구 이름
+            plan: _plan_incremental_run의 반환값
+            issues: 이번 실행에서 얻은 이슈 목록
+
+        Returns:
+            (프로젝트 전체 기준 이슈 목록, 다시 분석한 파일이 모두 성공했는지 여부)
+        """
+        stored_files, file_hashes, targets, fingerprint = plan
+
+        failed: Set[str] = set()
+        statuses: List[Dict[str, Any]] = []
+        issues_by_file: Dict[str, List[Dict[str, Any]]] = {path: [] for path in targets}
+        unmatched: List[Dict[str, Any]] = []
+        for issue in issues:
+            if 'file' not in issue:
+                status = dict(issue)
+                failed_files = status.pop('failed_files', None)
+                failed.update(targets if failed_files is None else failed_files)
+                statuses.append(status)
+                continue
+            path = posixpath.normpath(str(issue['file']).replace('\\', '/'))
+            if path in issues_by_file:
+                issues_by_file[path].append(issue)
+            else:
+                unmatched.append(issue)
+
+        files: Dict[str, Dict[str, Any]] = {}
+        for path, file_hash in file_hashes.items():
+            if path in issues_by_file and path not in failed:
+                files[path] = {'hash': file_hash, 'issues': issues_by_file[path]}
+            elif path in stored_files:
+                # 바뀌지 않은 파일, 또는 분석에 실패해 이전 결과를 유지하는 파일
+                files[path] = stored_files[path]
+
+        try:
+            self.cache_manager.save_result(
+                f"static_files_{tool}", {'fingerprint': fingerprint, 'files': files}
+            )
+        except (IOError, OSError) as e:
+            logger.warning("Failed to cache per-file %s results: %s", tool, e)
+
+        merged = [issue for entry in files.values() for issue in entry['issues']] + unmatched + statuses
+        return merged, not failed
+
+    def _run_tools(
+        self,
+        runners: List[Tuple[str, Optional[str], Callable[[], List[Dict[str, Any]]]]],
+        project_files: Optional[List[str]]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        도구별 캐시를 확인한 뒤, 캐시가 없는 도구만 동시에 실행합니다.
+
+        Args:
+            runners: (도구 이름, 대상 언어, 실행 함수) 목록. 대상 언어가 None이면 모든 파일 대상
+            project_files: 캐시 검증용 프로젝트 파일 목록 (캐시 미사용 시 None)
+
+        Returns:
+            (runners 순서대로 이어 붙인 이슈 목록, 증분 분석에 실패한 파일 없이 완료했는지 여부)
+        """
+        tool_issues: List[Optional[List[Dict[str, Any]]]] = [None] * len(runners)
+        tool_files: List[List[str]] = [[] for _ in runners]
+        # 캐시 검증 대상: 도구가 분석하는 파일 + 설정 파일/도구 실행 파일
+        cache_files: List[List[str]] = [[] for _ in runners]
+        dependency_files: List[List[str]] = [[] for _ in runners]
+
+        # 캐시 조회/저장은 하나의 캐시 파일을 다시 쓰므로 메인 스레드에서만 수행
+        if project_files is not None:
+            for index, (tool, language, _) in enumerate(runners):
+                if language is None:
+                    tool_files[index] = project_files
+                else:
+                    extensions = tuple(LANGUAGE_PATTERNS[language]['extensions'])
+                    tool_files[index] = [f for f in project_files if f.endswith(extensions)]
+                dependency_files[index] = self._tool_dependency_files(tool, project_files)
+                cache_files[index] = tool_files[index] + dependency_files[index]
+                cached = self.cache_manager.get_cached_result(
+                    f"static_tool_{tool}", cache_files[index]
+                )
+                if cached is not None:
+                    logger.info("Using cached %s results", tool)
+                    tool_issues[index] = cached['issues']
+
+        # 실행이 필요한 도구만 스레드 풀에서 동시에 실행
+        # (대부분 시간은 외부 도구가 소비하므로 전체 시간 = 가장 느린 도구 시간)
+        pending = [index for index, issues in enumerate(tool_issues) if issues is None]
+        complete = True
+
+        # 파일 단위 증분 분석이 가능한 도구는 바뀐 파일만 대상으로 실행
+        plans = {
+            index: self._plan_incremental_run(runners[index][0], tool_files[index], dependency_files[index])
+            for index in pending
+            if project_files is not None and runners[index][0] in INCREMENTAL_TOOLS
         }
 
-        # Run Pylint for Python projects
-        if 'python' in self.languages:
-            pylint_issues = self._run_pylint()
-            results['issues'].extend(pylint_issues)
-
-        # Run staticcheck for Go projects
-        if 'go' in self.languages:
-            staticcheck_issues = self._run_staticcheck()
-            results['issues'].extend(staticcheck_issues)
-
-        # Run clippy for Rust projects
-        if 'rust' in self.languages:
-            clippy_issues = self._run_clippy()
-            results['issues'].extend(clippy_issues)
-
-        # Run PHPStan for PHP projects
-        if 'php' in self.languages:
-            phpstan_issues = self._run_phpstan()
-            results['issues'].extend(phpstan_issues)
-
-        # Run RuboCop for Ruby projects
-        if 'ruby' in self.languages:
-            rubocop_issues = self._run_rubocop()
-            results['issues'].extend(rubocop_issues)
-
-        # Run ktlint for Kotlin projects
-        if 'kotlin' in self.languages:
-            ktlint_issues = self._run_ktlint()
-            results['issues'].extend(ktlint_issues)
-
-        # Run SwiftLint for Swift projects
-        if 'swift' in self.languages:
-            swiftlint_issues = self._run_swiftlint()
-            results['issues'].extend(swiftlint_issues)
-
-        # Run dotnet build for C# projects (Roslyn analyzers)
-        if 'csharp' in self.languages:
-            roslyn_issues = self._run_dotnet_build()
-            results['issues'].extend(roslyn_issues)
+        def run(index: int) -> List[Dict[str, Any]]:
+            if index not in plans:
+                return runners[index][2]()
+            targets = plans[index][2]
+            if targets == []:
+                # 바뀐 파일 없음 (파일 삭제만 있었던 경우)
+                return []
+            return runners[index][2](targets)
+
+        if pending:
+            # 이전 분석이 중단되었더라도 이번 분석의 도구는 실행
+            _cancel_event.clear()
+            with ThreadPoolExecutor(max_workers=min(len(pending), MAX_TOOL_WORKERS)) as executor:
+                try:
+                    for index, issues in zip(pending, executor.map(run, pending)):
+                        tool_complete = True
+                        if index in plans:
+                            issues, tool_complete = self._merge_incremental_run(
+                                runners[index][0], plans[index], issues
+                            )
+                        tool_issues[index] = issues
+                        # 실패한 파일이 있으면 결과를 캐시하지 않아 다음 실행에서 다시 분석
+                        complete = complete and tool_complete
+                        if project_files is not None and tool_complete:
+                            try:
+                                self.cache_manager.save_result(
+                                    f"static_tool_{runners[index][0]}", {'issues': issues}, cache_files[index]
+                                )
+                            except (IOError, OSError) as e:
+                                logger.warning("Failed to cache %s results: %s", runners[index][0], e)
+                except BaseException:
+                    # Ctrl+C 시 작업 스레드의 도구를 종료해야 executor 종료가 도구 시간 초과까지 기다리지 않음
+                    _kill_active_tools()
+                    raise
+
+        return [issue for issues in tool_issues for issue in issues], complete
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Run all applicable static analysis tools (with caching support).
+
+        Returns:
+            Dictionary containing analysis results from all tools
+        """
+        # 실행할 도구 목록: (캐시용 도구 이름, 대상 언어, 실행 함수)
+        runners: List[Tuple[str, Optional[str], Callable[[], List[Dict[str, Any]]]]] = []
+        # 도구를 실행하지 않고 결과 끝에 붙이는 안내 메시지
+        notices: List[Dict[str, Any]] = []
+
+        # 감지된 언어별 린터 (LANGUAGE_TOOL_RUNNERS 순서 = 결과 이슈 순서)
+        runners.extend(
+            (tool, language, getattr(self, method_name))
+            for language, tool, method_name in LANGUAGE_TOOL_RUNNERS
+            if language in self.languages
+        )
 
         # Run Semgrep for security analysis (if deployment mode and installed)
         if self.mode == 'deployment':
             if self._check_tool_installed('semgrep'):
-                semgrep_issues = self._run_semgrep()
-                results['issues'].extend(semgrep_issues)
+                runners.append(('semgrep', None, self._run_semgrep))
             else:
                 # Semgrep not available (normal on Windows)
-                results['issues'].append({
+                notices.append({
                     'tool': 'semgrep',
                     'severity': 'info',
                     'message': 'Semgrep is not available on Windows. For security scanning, use WSL or Linux.',
@@ -858,25 +1414,47 @@ class StaticAnalyzer:
 
         # Run jscpd for duplication detection (if personal mode)
         if self.mode == 'personal':
-            jscpd_issues = self._run_jscpd()
-            results['issues'].extend(jscpd_issues)
+            runners.append(('jscpd', None, self._run_jscpd))
+
+        # Check cache first
+        cache_key = f"static_analysis_{self.mode}"
+        project_files = None
+        cache_files: List[str] = []
+
+        if self.use_cache and self.cache_manager:
+            # Collect all code files for cache validation (한 번만 순회해 도구별 캐시에도 재사용)
+            project_files = self._collect_project_files()
+            # 설정/빌드 파일은 project_files에 이미 있으므로 빈 목록을 넘겨 도구 실행 파일만 추가
+            # (도구를 업그레이드하면 소스가 그대로여도 전체 결과 캐시를 버림)
+            cache_files = project_files + [
+                path for tool, _, _ in runners for path in self._tool_dependency_files(tool, [])
+            ]
+
+            cached_result = self.cache_manager.get_cached_result(cache_key, cache_files)
+            if cached_result:
+                logger.info("Using cached static analysis results")
+                return cached_result
+
+        logger.info("Running static analysis (no cache)")
+
+        issues, complete = self._run_tools(runners, project_files)
+        results = {
+            'mode': self.mode,
+            'languages': self.language_list,
+            'issues': issues + notices
+        }
 
         # Count issues by severity
-        severity_counts = {'critical': 0, 'warning': 0, 'info': 0}
-        for issue in results['issues']:
-            severity = issue.get('severity', 'info')
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        counts = Counter(issue.get('severity', 'info') for issue in results['issues'])
+        severity_counts = {severity: counts[severity] for severity in ('critical', 'warning', 'info')}
 
         results['summary'] = {
             'total_issues': len(results['issues']),
             'by_severity': severity_counts
         }
 
-        # Save to cache
-        if self.use_cache and self.cache_manager:
-            project_files = list(self.project_path.rglob('*'))
-            project_files = [f for f in project_files if f.is_file()]
-            self.cache_manager.save_result(cache_key, results, project_files)
+        # Save to cache (분석에 실패한 파일이 있으면 다음 실행에서 다시 분석하도록 저장하지 않음)
+        if project_files is not None and complete:
+            self.cache_manager.save_result(cache_key, results, cache_files)
 
         return results
@@ -71,6 +71,13 @@ DEFAULT_EXCLUDE_PATTERNS = [
 
 MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "10"))
 
+# Semgrep 규칙 설정 (기본값 auto: 실행마다 레지스트리에서 규칙을 내려받음)
+# 로컬 규칙 파일 경로나 고정된 규칙 묶음(p/ci 등)을 지정하면 네트워크/텔레메트리 없이 실행 가능
+SEMGREP_CONFIG = os.getenv("SEMGREP_CONFIG", "auto").strip() or "auto"
+
+# AI 분석 시 동시에 보낼 Claude API 요청 수 (계정의 rate limit에 맞춰 조정, 최소 1)
+MAX_CONCURRENT_REQUESTS = max(1, int(os.getenv("MAX_CONCURRENT_REQUESTS", "5")))
+
 # Language Detection Patterns
 LANGUAGE_PATTERNS = {
     "python": {
@@ -8,10 +8,9 @@ from pathlib import Path
 from typing import Optional, Dict, Any, Callable, List
 import logging
 
-from src.config.settings import ANTHROPIC_API_KEY, validate_api_key
+from src.config.settings import ANTHROPIC_API_KEY, MAX_CONCURRENT_REQUESTS, validate_api_key
 from src.detectors.language_detector import LanguageDetector
 from src.analyzers.static_analyzer import StaticAnalyzer
-from src.analyzers.ai_analyzer import AIAnalyzer
 from src.utils.history_tracker import HistoryTracker
 
 logger = logging.getLogger(__name__)
@@ -205,7 +204,16 @@ class AnalyzerEngine:
                 self._update_progress("ai_analysis", "Running AI code review...", 70)
                 logger.info("Starting AI analysis")
 
-                ai_analyzer = AIAnalyzer(self.project_path, self.mode)
+                # Imported here so static-only runs (--skip-ai) never load the
+                # anthropic SDK and its httpx/pydantic dependency tree.
+                from src.analyzers.ai_analyzer import AIAnalyzer  # pylint: disable=import-outside-toplevel
+
+                ai_analyzer = AIAnalyzer(
+                    self.project_path,
+                    self.mode,
+                    use_cache=self.use_cache,
+                    max_concurrent_requests=MAX_CONCURRENT_REQUESTS
+                )
                 ai_results = ai_analyzer.analyze()
 
                 logger.info("AI analysis completed")
@@ -159,6 +159,10 @@ class CLIReporter:
             self.console.print(f"[yellow]⚠ AI 분석 오류: {ai_results['error']}[/yellow]\n")
             return
 
+        # 일부 배치 요청만 실패한 경우: 결과는 보여주되 일부 파일이 빠졌음을 알림
+        if ai_results.get('warning'):
+            self.console.print(f"[yellow]⚠ AI 분석 경고: {ai_results['warning']}[/yellow]\n")
+
         issues = ai_results.get('issues', [])
 
         if not issues:
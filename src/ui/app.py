@@ -1175,6 +1175,10 @@ def render_ai_analysis_tab(ai_results: Optional[Dict[str, Any]]):
         st.info("🔑 API 키 설정, 네트워크 연결, 타임아웃 설정 등을 확인해 주세요.")
         return
 
+    # 일부 배치 요청만 실패한 경우: 결과는 보여주되 일부 파일이 빠졌음을 알림
+    if ai_results.get("warning"):
+        st.warning(f"AI 분석 일부가 실패했습니다: {ai_results['warning']}")
+
     issues = ai_results.get("issues", [])
 
     if not issues:
@@ -2,6 +2,7 @@
 
 import json
 import hashlib
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -56,7 +57,7 @@ class CacheManager:
             logger.debug("Failed to hash %s: %s", file_path, e)
             return ""
 
-    def _compute_project_hash(self, files: list[Path]) -> str:
+    def _compute_project_hash(self, files: list[str | Path]) -> str:
         """
         Compute combined hash of all project files.
 
@@ -70,7 +71,7 @@ class CacheManager:
         for file_path in sorted(files):
             try:
                 # Include file path and modification time for quick check
-                stat = file_path.stat()
+                stat = os.stat(file_path)
                 combined.append(f"{file_path}:{stat.st_mtime}:{stat.st_size}")
             except (OSError, PermissionError) as e:
                 logger.debug("Failed to stat %s: %s", file_path, e)
@@ -95,7 +96,7 @@ class CacheManager:
                 cache_data = json.load(f)
             logger.debug("Loaded cache with %d entries", len(cache_data))
             return cache_data
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error("Failed to parse cache file: %s", e, exc_info=True)
             return {}
         except (IOError, OSError) as e:
@@ -120,7 +121,7 @@ class CacheManager:
     def get_cached_result(
         self,
         cache_key: str,
-        project_files: Optional[list[Path]] = None
+        project_files: Optional[list[str | Path]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Get cached analysis result if valid.
@@ -162,7 +163,7 @@ class CacheManager:
         self,
         cache_key: str,
         result: Dict[str, Any],
-        project_files: Optional[list[Path]] = None
+        project_files: Optional[list[str | Path]] = None
     ) -> None:
         """
         Save analysis result to cache.
@@ -1,11 +1,18 @@
 """Tests for ai_analyzer module with mocked API calls."""
 
+import os
+
 import pytest
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 import anthropic
 
-from src.analyzers.ai_analyzer import AIAnalyzer, DEFAULT_CLAUDE_TIMEOUT
+from src.analyzers.ai_analyzer import (
+    AIAnalyzer, DEFAULT_CLAUDE_TIMEOUT, ESTIMATED_COMPLEXITY_PER_KB, MAX_PROMPT_CHARS_PER_FILE,
+    MAX_PROMPT_FILES, MAX_SAMPLE_FILE_BYTES, PROMPT_BATCH_SIZE
+)
+from src.utils.cache_manager import CacheManager
 
 
 @pytest.mark.unit
@@ -354,9 +361,9 @@ class TestAIAnalyzer:
 
     def test_collect_code_samples_line_limit(self, temp_project_dir):
         """Test that code samples are limited to 500 lines."""
-        # Create a large file
+        # Create a large file (short lines so 500 lines fit in the prompt char budget)
         large_file = temp_project_dir / 'large.py'
-        large_content = '\n'.join([f'# Line {i}' for i in range(1000)])
+        large_content = '\n'.join(['x'] * 1000)
         large_file.write_text(large_content)
 
         with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
@@ -370,11 +377,23 @@ class TestAIAnalyzer:
                     found = True
                     # Count lines using splitlines() which is more accurate
                     line_count = len(sample['content'].splitlines())
-                    # readlines()[:500] reads first 500 lines, so we expect exactly 500
+                    # Reads stop after the 500th newline, so we expect exactly 500
                     assert line_count == 500, f"Expected 500 lines, got {line_count}"
 
             assert found, "large.py not found in samples"
 
+    def test_collect_code_samples_char_limit(self, temp_project_dir):
+        """Test that sample content is truncated to the per-file prompt budget."""
+        (temp_project_dir / 'long.py').write_text('\n'.join(f'# Line {i}' for i in range(400)))
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            samples = analyzer._collect_code_samples()
+
+            assert len(samples) == 1
+            assert len(samples[0]['content']) == MAX_PROMPT_CHARS_PER_FILE
+            assert samples[0]['content'].startswith('# Line 0\n# Line 1\n')
+
     def test_api_timeout_parameter(self, sample_project):
         """Test that API calls include timeout parameter."""
         mock_client = MagicMock()
@@ -392,3 +411,401 @@ class TestAIAnalyzer:
             call_kwargs = mock_client.messages.create.call_args[1]
             assert 'timeout' in call_kwargs
             assert call_kwargs['timeout'] == DEFAULT_CLAUDE_TIMEOUT
+
+    def test_find_candidate_files_does_not_read(self, sample_project):
+        """Test that candidate discovery filters on path metadata only."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(sample_project, 'deployment')
+
+            with patch('builtins.open', side_effect=AssertionError('file was opened')):
+                candidates = analyzer._find_candidate_files(skip_analyzed=True)
+
+            # The empty __init__.py is dropped by its size, without opening it
+            names = sorted(os.path.basename(p) for p in candidates)
+            assert names == ['helpers.py', 'main.py', 'utils.py']
+
+    def test_parse_response_marker_variants(self, sample_project):
+        """Test that every severity marker variant is detected and stripped from titles."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(sample_project, 'deployment')
+
+            result = analyzer._parse_ai_response(
+                "🔴 Hardcoded secret\n"
+                "Warning: Slow loop\n"
+                "[Info] Add type hints\n"
+            )
+
+            parsed = [(i['severity'], i['title']) for i in result['issues']]
+            assert parsed == [
+                ('critical', 'Hardcoded secret'),
+                ('warning', 'Slow loop'),
+                ('info', 'Add type hints'),
+            ]
+
+    def test_collect_code_samples_skips_oversized_files(self, temp_project_dir):
+        """Test that files above MAX_SAMPLE_FILE_BYTES are never read."""
+        (temp_project_dir / 'main.py').write_text('print("main")')
+        (temp_project_dir / 'bundle.js').write_text('x' * (MAX_SAMPLE_FILE_BYTES + 1))
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            samples = analyzer._collect_code_samples()
+
+            paths = [s['path'] for s in samples]
+            assert paths == ['main.py']
+
+    def test_analyze_batches_requests(self, temp_project_dir):
+        """Test that the top samples are split into batches and the responses are merged."""
+        for i in range(MAX_PROMPT_FILES + 5):
+            (temp_project_dir / f'module_{i}.py').write_text(f'def func_{i}():\n    return {i}\n')
+
+        mock_client = MagicMock()
+        mock_message = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = "**[Warning] Batch issue**\n- 설명: 배치 결과"
+        mock_message.content = [mock_content]
+        mock_client.messages.create.return_value = mock_message
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic', return_value=mock_client):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            result = analyzer.analyze()
+
+            # 수집한 샘플 중 상위 MAX_PROMPT_FILES개만 배치로 나눠 전송
+            batch_count = -(-MAX_PROMPT_FILES // PROMPT_BATCH_SIZE)
+            prompts = [call.kwargs['messages'][0]['content'] for call in mock_client.messages.create.call_args_list]
+            assert len(prompts) == batch_count
+            assert sum(prompt.count('### File ') for prompt in prompts) == MAX_PROMPT_FILES
+            assert result['summary']['total_issues'] == batch_count
+            assert result['summary']['by_severity']['warning'] == batch_count
+            assert 'warning' not in result
+
+    def test_build_analysis_prompt_reports_overall_sample_count(self, sample_project):
+        """Test that a batch prompt names the overall sample count and does not demand issues."""
+        code_samples = [{'path': f'm{i}.py', 'content': 'x = 1', 'extension': '.py'} for i in range(2)]
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(sample_project, 'deployment')
+            prompt = analyzer._build_analysis_prompt(code_samples, total_files=50, first_index=11)
+
+            assert '총 50개 중 11-12번 파일 (2개)' in prompt
+            assert '### File 11/50: m0.py' in prompt
+            assert '### File 12/50: m1.py' in prompt
+            assert '최소 5개' not in prompt
+
+    def test_analyze_partial_batch_failure_sets_warning(self, temp_project_dir):
+        """Test that a failed batch is reported in the result while other batches are kept."""
+        for i in range(PROMPT_BATCH_SIZE + 1):
+            (temp_project_dir / f'module_{i}.py').write_text(f'def func_{i}():\n    return {i}\n')
+
+        mock_content = MagicMock()
+        mock_content.text = "**[Warning] Batch issue**"
+        mock_message = MagicMock()
+        mock_message.content = [mock_content]
+        mock_client = MagicMock()
+        mock_client.messages.create.side_effect = [
+            mock_message,
+            anthropic.APIConnectionError(message="Connection failed", request=MagicMock()),
+        ]
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic', return_value=mock_client):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment', max_concurrent_requests=1)
+            result = analyzer.analyze()
+
+            assert 'error' not in result
+            assert result['summary']['total_issues'] == 1
+            assert result['warning'].startswith('1 of 2 AI review request(s) failed')
+
+    def test_collect_code_samples_skips_binary_files(self, temp_project_dir):
+        """Test that files containing NUL bytes are treated as binary and skipped."""
+        (temp_project_dir / 'main.py').write_text('print("main")')
+        (temp_project_dir / 'blob.py').write_bytes(b'\x7fELF\x00\x00\x01' * 16)
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            samples = analyzer._collect_code_samples()
+
+            paths = [s['path'] for s in samples]
+            assert paths == ['main.py']
+
+    def test_analyze_reuses_cached_result(self, sample_project):
+        """Test that unchanged code samples are served from cache without an API call."""
+        mock_client = MagicMock()
+        mock_message = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = "**[Critical] Cached issue**\n- 설명: 캐시 테스트"
+        mock_message.content = [mock_content]
+        mock_client.messages.create.return_value = mock_message
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic', return_value=mock_client):
+            first = AIAnalyzer(sample_project, 'deployment').analyze()
+            second = AIAnalyzer(sample_project, 'deployment').analyze()
+            AIAnalyzer(sample_project, 'personal').analyze()
+
+            assert second == first
+            # deployment 1회 + personal 1회 (두 번째 deployment 실행은 캐시 사용)
+            assert mock_client.messages.create.call_count == 2
+
+    def test_analyze_without_cache(self, sample_project):
+        """Test that use_cache=False always calls the API."""
+        mock_client = MagicMock()
+        mock_message = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = "**[Info] Uncached issue**"
+        mock_message.content = [mock_content]
+        mock_client.messages.create.return_value = mock_message
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic', return_value=mock_client):
+            AIAnalyzer(sample_project, 'deployment', use_cache=False).analyze()
+            AIAnalyzer(sample_project, 'deployment', use_cache=False).analyze()
+
+            assert mock_client.messages.create.call_count == 2
+            assert not (sample_project / '.vibe-auditor-cache').exists()
+
+    def test_collect_code_samples_project_inside_excluded_name(self, temp_project_dir):
+        """Test that exclusion applies inside the project, not to the project's own parent dirs."""
+        project = temp_project_dir / 'build' / 'app'
+        (project / 'src' / 'node_modules').mkdir(parents=True)
+        (project / 'main.py').write_text('print("main")')
+        (project / 'src' / 'node_modules' / 'dep.js').write_text('module.exports = 1;')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(project, 'deployment')
+            samples = analyzer._collect_code_samples()
+
+            paths = [s['path'] for s in samples]
+            assert paths == ['main.py']
+
+    def test_find_candidate_files_includes_deep_files(self, temp_project_dir):
+        """Test that every code file is a candidate regardless of depth or walk order."""
+        deep = temp_project_dir / 'a' / 'b'
+        deep.mkdir(parents=True)
+        for i in range(3):
+            (temp_project_dir / f'root_{i}.py').write_text('x = 1')
+        (deep / 'main.py').write_text('x = 1')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            candidates = analyzer._find_candidate_files(skip_analyzed=True)
+
+            assert sorted(candidates) == [
+                os.path.join('a', 'b', 'main.py'), 'root_0.py', 'root_1.py', 'root_2.py'
+            ]
+
+    def test_calculate_file_score_counts_complexity(self, temp_project_dir):
+        """Test that functions, classes and imports are weighted in the score."""
+        content = b"import os\n\nclass Foo:\n    def bar(self):\n        pass\n"
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            score = analyzer._calculate_file_score('a.py', content, line_count=5, is_high_priority=False)
+
+            # depth 1 (+40) + import (+3) + class (+10) + def (+5)
+            assert score == 58
+
+    def test_calculate_file_score_estimates_complexity_for_top_paths(self, temp_project_dir):
+        """Test that files ranked high by path alone get a size-based complexity estimate."""
+        # 정규식으로 세면 함수/클래스/import가 많지만, 크기(2KB) 기준 추정치만 반영되어야 함
+        content = b"import os\nclass Foo:\n    def bar(self):\n        pass\n".ljust(2048, b'#')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            score = analyzer._calculate_file_score('main.py', content, line_count=5, is_high_priority=True)
+
+            # depth 1 (+40) + high (+100) + 2KB × 12
+            assert score == 140 + 2 * ESTIMATED_COMPLEXITY_PER_KB
+
+    def test_collect_code_samples_reuses_cached_scores(self, temp_project_dir):
+        """Test that unchanged files are not rescored on the next run."""
+        (temp_project_dir / 'main.py').write_text('def main():\n    pass\n')
+        (temp_project_dir / 'utils.py').write_text('def helper():\n    pass\n')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            first = AIAnalyzer(temp_project_dir, 'deployment')._collect_code_samples()
+
+            second_analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            with patch.object(second_analyzer, '_calculate_file_score') as mock_score:
+                second = second_analyzer._collect_code_samples()
+
+            mock_score.assert_not_called()
+            assert second == first
+
+    def test_collect_code_samples_skips_duplicate_content(self, temp_project_dir):
+        """Test that identical copies of a file are only sampled once."""
+        (temp_project_dir / 'app.py').write_text('def run():\n    pass\n')
+        copy_dir = temp_project_dir / 'third_party'
+        copy_dir.mkdir()
+        (copy_dir / 'app.py').write_text('def run():\n    pass\n')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            samples = analyzer._collect_code_samples()
+
+            # The shallower copy scores higher and is the one kept
+            assert [s['path'] for s in samples] == ['app.py']
+
+    def test_collect_code_samples_drops_content_outside_top(self, temp_project_dir):
+        """Test that only the top-ranked files keep their content in memory."""
+        (temp_project_dir / 'main.py').write_text('def main():\n    pass\n')
+        nested = temp_project_dir / 'pkg' / 'sub'
+        nested.mkdir(parents=True)
+        (nested / 'extra.py').write_text('x = 1\n')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            with patch.object(analyzer, '_save_score_cache') as mock_save:
+                samples = analyzer._collect_code_samples(max_files=1)
+
+            assert [s['path'] for s in samples] == ['main.py']
+            file_scores = mock_save.call_args[0][1]
+            dropped = [f for f in file_scores if f['path'] != 'main.py']
+            assert [f['content'] for f in dropped] == [None]
+
+    def test_collect_code_samples_prefilters_by_path_score(self, temp_project_dir):
+        """Test that low path-score files are not read when candidates are plentiful."""
+        (temp_project_dir / 'main.py').write_text('def main():\n    pass\n')
+        deep = temp_project_dir / 'a' / 'b' / 'c'
+        deep.mkdir(parents=True)
+        for i in range(3):
+            (deep / f'util_{i}.py').write_text('x = 1\n')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'), \
+                patch('src.analyzers.ai_analyzer.PATH_PREFILTER_FACTOR', 2):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            with patch.object(analyzer, '_read_and_score', wraps=analyzer._read_and_score) as mock_read:
+                samples = analyzer._collect_code_samples(max_files=1)
+
+            assert mock_read.call_count == 2
+            assert samples[0]['path'] == 'main.py'
+
+    def test_parse_response_standard_header_keeps_title(self, sample_project):
+        """Test that a standard header's severity wins over marker words in its title."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(sample_project, 'deployment')
+
+            result = analyzer._parse_ai_response("**[Info] Critical path logging**\n- 설명: 로그 개선")
+
+            assert result['issues'][0]['severity'] == 'info'
+            assert result['issues'][0]['title'] == 'Critical path logging'
+
+    def test_analyze_limits_concurrent_requests(self, temp_project_dir):
+        """Test that max_concurrent_requests bounds the API worker pool."""
+        for i in range(PROMPT_BATCH_SIZE * 2 + 1):
+            (temp_project_dir / f'module_{i}.py').write_text(f'def func_{i}():\n    return {i}\n')
+
+        mock_client = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = "**[Info] Batch issue**"
+        mock_client.messages.create.return_value.content = [mock_content]
+
+        # 상위 MAX_PROMPT_FILES(20)개 샘플을 3개 배치로 나눔
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic', return_value=mock_client), \
+                patch('src.analyzers.ai_analyzer.PROMPT_BATCH_SIZE', 7), \
+                patch('src.analyzers.ai_analyzer.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_pool:
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment', max_concurrent_requests=2)
+            result = analyzer.analyze()
+
+            assert mock_pool.call_args_list[-1].kwargs == {'max_workers': 2}
+            assert result['summary']['total_issues'] == 3
+
+    def test_find_candidate_files_skips_generated_files(self, temp_project_dir):
+        """Test that minified, bundled and generated files are not candidates."""
+        for name in ('app.js', 'app.min.js', 'vendor.bundle.js', 'api_pb2.py', 'schema.generated.ts'):
+            (temp_project_dir / name).write_text('x = 1')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            candidates = analyzer._find_candidate_files(skip_analyzed=True)
+
+            assert candidates == ['app.js']
+
+    def test_find_candidate_files_keeps_large_high_priority_files(self, temp_project_dir):
+        """Test that the size cap does not drop high-priority files."""
+        (temp_project_dir / 'main.py').write_text('x = 1\n' * (MAX_SAMPLE_FILE_BYTES // 6 + 1))
+        (temp_project_dir / 'data.js').write_text('x' * (MAX_SAMPLE_FILE_BYTES + 1))
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            candidates = analyzer._find_candidate_files(skip_analyzed=True)
+
+            assert candidates == ['main.py']
+
+    def test_path_score_filename_patterns(self, temp_project_dir):
+        """Test filename pattern bonuses and penalties in the path score."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+
+            # depth 1 (+40) + high (+100) + medium (+50)
+            assert analyzer._path_score('app_model.py') == 190
+            # depth 1 (+40) - 'test' (-30) - 'util' (-30)
+            assert analyzer._path_score('test_utils.py') == -20
+            # depth 3 (+20)
+            assert analyzer._path_score(os.path.join('a', 'b', 'x.py')) == 20
+
+    def test_read_head_stops_at_line_limit(self, temp_project_dir):
+        """Test that the byte-budget read is trimmed after max_lines lines."""
+        file_path = temp_project_dir / 'a.py'
+        file_path.write_bytes(b'a = 1\nb = 2\nc = 3')
+
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+
+            assert analyzer._read_head(str(file_path), 2) == (b'a = 1\nb = 2\n', 2)
+            assert analyzer._read_head(str(file_path), 5) == (b'a = 1\nb = 2\nc = 3', 3)
+
+    def test_parse_response_leading_marker_sets_severity(self, sample_project):
+        """Test that the first severity marker on a line decides the severity."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(sample_project, 'deployment')
+
+            result = analyzer._parse_ai_response("🟡 Warning: critical section is not locked")
+
+            assert result['issues'][0]['severity'] == 'warning'
+
+    def test_parse_response_detail_fields_stay_details(self, sample_project):
+        """Test that '- 제안:' style detail lines are not mistaken for Info headers."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(sample_project, 'deployment')
+
+            result = analyzer._parse_ai_response(
+                "**[Critical] SQL Injection**\n- 설명: 경고 없이 실행됨\n- 제안: Prepared statements 사용"
+            )
+
+            assert len(result['issues']) == 1
+            assert result['issues'][0]['details'] == ['설명: 경고 없이 실행됨', '제안: Prepared statements 사용']
+
+    def test_analyze_only_requests_changed_batches(self, temp_project_dir):
+        """Test that cached responses are reused per batch when one file changes."""
+        for i in range(PROMPT_BATCH_SIZE * 2 + 1):
+            (temp_project_dir / f'module_{i}.py').write_text(f'def func_{i}():\n    return {i}\n')
+
+        mock_client = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = "**[Warning] Batch issue**"
+        mock_client.messages.create.return_value.content = [mock_content]
+
+        # 상위 MAX_PROMPT_FILES(20)개 샘플을 3개 배치로 나눔
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic', return_value=mock_client), \
+                patch('src.analyzers.ai_analyzer.PROMPT_BATCH_SIZE', 7):
+            AIAnalyzer(temp_project_dir, 'deployment').analyze()
+            (temp_project_dir / 'module_0.py').write_text('def func_0():\n    return -1\n')
+            result = AIAnalyzer(temp_project_dir, 'deployment').analyze()
+
+            # 3 batches on the first run, then only the batch holding module_0.py
+            assert mock_client.messages.create.call_count == 4
+            assert result['summary']['total_issues'] == 3
+
+            # 바뀌기 전 module_0.py 배치의 응답은 캐시에서 제거되고 현재 배치 응답만 남음
+            cache = CacheManager(temp_project_dir)
+            responses = cache.get_cached_result('ai_responses_deployment')['responses']
+            assert len(responses) == 3
+            assert len(cache.get_cache_stats()['entries']) == 2  # 응답 캐시 + 점수 캐시
+
+    def test_save_responses_ignores_unencodable_text(self, temp_project_dir):
+        """Test that a response that cannot be written as UTF-8 does not fail the analysis."""
+        with patch('src.analyzers.ai_analyzer.anthropic.Anthropic'):
+            analyzer = AIAnalyzer(temp_project_dir, 'deployment')
+            response = {'timestamp': '2026-01-01T00:00:00', 'response': 'bad_\udcff.py'}
+
+            analyzer._save_responses({'digest': response})
+
+            assert analyzer._load_responses() == {}
@@ -0,0 +1,480 @@
+"""Tests for static_analyzer module with mocked tool runs."""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from src.analyzers.static_analyzer import (
+    PYLINT_MAX_FILES_PER_RUN, StaticAnalyzer, _run_tool, _split_by_size, _which
+)
+
+
+@pytest.mark.unit
+class TestStaticAnalyzer:
+    """Test cases for StaticAnalyzer class without running real tools."""
+
+    def test_analyze_runs_tools_concurrently(self, temp_project_dir):
+        """Test that language tools run at the same time and keep issue order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_runner(tool):
+            def run():
+                # 두 도구가 동시에 실행되지 않으면 barrier 대기가 시간 초과로 실패
+                barrier.wait()
+                return [{'tool': tool, 'severity': 'warning', 'message': tool}]
+            return run
+
+        analyzer = StaticAnalyzer(temp_project_dir, ['python', 'go'], 'personal', use_cache=False)
+        with patch.object(analyzer, '_run_pylint', make_runner('pylint')), \
+                patch.object(analyzer, '_run_staticcheck', make_runner('staticcheck')), \
+                patch.object(analyzer, '_run_jscpd', return_value=[]):
+            results = analyzer.analyze()
+
+        assert [issue['tool'] for issue in results['issues']] == ['pylint', 'staticcheck']
+        assert results['summary']['by_severity']['warning'] == 2
+
+    def test_analyze_reuses_cached_tool_results(self, temp_project_dir):
+        """Test that a tool is not rerun when its language files are unchanged."""
+        (temp_project_dir / 'main.py').write_text('x = 1\n')
+        (temp_project_dir / 'main.go').write_text('package main\n')
+        pylint_issue = {'tool': 'pylint', 'file': 'main.py', 'severity': 'info', 'message': 'm'}
+
+        def run_analysis():
+            analyzer = StaticAnalyzer(temp_project_dir, ['python', 'go'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_pylint', return_value=[pylint_issue]) as pylint, \
+                    patch.object(analyzer, '_run_staticcheck', return_value=[]) as staticcheck, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                results = analyzer.analyze()
+            return results, pylint.call_count, staticcheck.call_count
+
+        assert run_analysis()[1:] == (1, 1)
+
+        # Go 파일만 바뀌면 staticcheck만 다시 실행
+        (temp_project_dir / 'util.go').write_text('package main\n')
+        results, pylint_calls, staticcheck_calls = run_analysis()
+
+        assert (pylint_calls, staticcheck_calls) == (0, 1)
+        assert results['issues'] == [pylint_issue]
+
+    def test_analyze_reruns_rubocop_on_changed_files_only(self, temp_project_dir):
+        """Test that rubocop only re-analyzes changed files and keeps the rest cached."""
+        (temp_project_dir / 'a.rb').write_text('x = 1\n')
+        (temp_project_dir / 'b.rb').write_text('y = 2\n')
+        issue_a = {'tool': 'rubocop', 'file': 'a.rb', 'severity': 'info', 'message': 'a'}
+        issue_b = {'tool': 'rubocop', 'file': 'b.rb', 'severity': 'info', 'message': 'b'}
+
+        def run_analysis(rubocop_issues):
+            analyzer = StaticAnalyzer(temp_project_dir, ['ruby'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_rubocop', return_value=rubocop_issues) as rubocop, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                results = analyzer.analyze()
+            return results, rubocop
+
+        _, rubocop = run_analysis([issue_a])
+        rubocop.assert_called_once_with(['a.rb', 'b.rb'])
+
+        (temp_project_dir / 'b.rb').write_text('y = 3\n')
+        results, rubocop = run_analysis([issue_b])
+
+        rubocop.assert_called_once_with(['b.rb'])
+        assert results['issues'] == [issue_a, issue_b]
+
+    def test_analyze_reruns_whole_pylint_project_on_any_change(self, temp_project_dir):
+        """Test that pylint results are not reused per file (cross-module checks)."""
+        (temp_project_dir / 'a.py').write_text('import b\nb.run()\n')
+        (temp_project_dir / 'b.py').write_text('def run():\n    pass\n')
+        stale = {'tool': 'pylint', 'file': 'a.py', 'severity': 'critical', 'message': 'no-member'}
+
+        def run_analysis(pylint_issues):
+            analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_pylint', return_value=pylint_issues) as pylint, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                results = analyzer.analyze()
+            return results, pylint
+
+        _, pylint = run_analysis([])
+        pylint.assert_called_once_with()
+
+        # b.py만 바뀌어도 a.py의 결과가 달라질 수 있으므로 프로젝트 전체를 다시 분석
+        (temp_project_dir / 'b.py').write_text('def start():\n    pass\n')
+        results, pylint = run_analysis([stale])
+
+        pylint.assert_called_once_with()
+        assert results['issues'] == [stale]
+
+    def test_analyze_keeps_cached_issues_when_incremental_run_fails(self, temp_project_dir):
+        """Test that a failed re-run keeps unchanged files' issues and is retried next time."""
+        (temp_project_dir / 'a.rb').write_text('x = 1\n')
+        (temp_project_dir / 'b.rb').write_text('y = 2\n')
+        issue_a = {'tool': 'rubocop', 'file': 'a.rb', 'severity': 'info', 'message': 'A'}
+        issue_b = {'tool': 'rubocop', 'file': 'b.rb', 'severity': 'info', 'message': 'B'}
+        timed_out = {'tool': 'rubocop', 'severity': 'warning', 'message': 'RuboCop analysis timed out'}
+
+        def run_analysis(rubocop_issues):
+            analyzer = StaticAnalyzer(temp_project_dir, ['ruby'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_rubocop', return_value=rubocop_issues) as rubocop, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                results = analyzer.analyze()
+            return [issue['message'] for issue in results['issues']], rubocop
+
+        run_analysis([issue_a, issue_b])
+
+        (temp_project_dir / 'b.rb').write_text('y = 3\n')
+        messages, rubocop = run_analysis([timed_out])
+        rubocop.assert_called_once_with(['b.rb'])
+        assert messages == ['A', 'B', timed_out['message']]
+
+        # 실패한 파일은 캐시되지 않았으므로 다시 분석
+        messages, rubocop = run_analysis([issue_b])
+        rubocop.assert_called_once_with(['b.rb'])
+        assert messages == ['A', 'B']
+
+    def test_merge_incremental_run_keeps_only_failed_files_stale(self, temp_project_dir):
+        """Test that status entries naming failed files only affect those files."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['ruby'], 'personal', use_cache=True)
+        stored = {'a.rb': {'hash': 'old', 'issues': [{'file': 'a.rb', 'message': 'old A'}]}}
+        plan = (stored, {'a.rb': 'new', 'b.rb': 'new'}, ['a.rb', 'b.rb'], 'fp')
+        failure = {'tool': 'rubocop', 'severity': 'warning', 'message': 'failed', 'failed_files': ['a.rb']}
+
+        issues, complete = analyzer._merge_incremental_run(
+            'rubocop', plan, [{'file': 'a.rb', 'message': 'partial'}, {'file': 'b.rb', 'message': 'B'}, failure]
+        )
+
+        assert not complete
+        assert [issue['message'] for issue in issues] == ['old A', 'B', 'failed']
+        assert 'failed_files' not in issues[-1]
+        saved = analyzer.cache_manager.get_cached_result('static_files_rubocop')['files']
+        assert saved['a.rb']['hash'] == 'old'
+        assert saved['b.rb']['hash'] == 'new'
+
+    def test_analyze_reruns_tool_after_upgrade(self, temp_project_dir, tmp_path):
+        """Test that replacing a tool executable invalidates the whole-result cache."""
+        (temp_project_dir / 'a.py').write_text('x = 1\n')
+        executable = tmp_path / 'pylint'
+        executable.write_text('#!/bin/sh\n')
+
+        def run_analysis():
+            analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=True)
+            with patch('src.analyzers.static_analyzer._which',
+                       side_effect=lambda command: str(executable) if command == 'pylint' else None), \
+                    patch.object(analyzer, '_run_pylint', return_value=[]) as pylint, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                analyzer.analyze()
+            return pylint.call_count
+
+        assert run_analysis() == 1
+        assert run_analysis() == 0
+
+        stat = executable.stat()
+        os.utime(executable, (stat.st_atime, stat.st_mtime + 10))
+        assert run_analysis() == 1
+
+    def test_analyze_reruns_tool_after_change_in_nested_build_package(self, temp_project_dir):
+        """Test that a source package named like a build directory invalidates the cache."""
+        (temp_project_dir / 'internal' / 'build').mkdir(parents=True)
+        source = temp_project_dir / 'internal' / 'build' / 'build.go'
+        source.write_text('package build\n')
+
+        def run_analysis():
+            analyzer = StaticAnalyzer(temp_project_dir, ['go'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_staticcheck', return_value=[]) as staticcheck, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                analyzer.analyze()
+            return staticcheck.call_count
+
+        assert run_analysis() == 1
+        source.write_text('package build\n\nfunc Run() {}\n')
+        assert run_analysis() == 1
+
+    def test_analyze_reruns_tool_after_nested_project_file_change(self, temp_project_dir):
+        """Test that editing a nested project file invalidates the cached tool results."""
+        (temp_project_dir / 'src' / 'App').mkdir(parents=True)
+        (temp_project_dir / 'src' / 'App' / 'Program.cs').write_text('class Program {}\n')
+        project_file = temp_project_dir / 'src' / 'App' / 'App.csproj'
+        project_file.write_text('<Project Sdk="Microsoft.NET.Sdk"></Project>\n')
+
+        def run_analysis():
+            analyzer = StaticAnalyzer(temp_project_dir, ['csharp'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_dotnet_build', return_value=[]) as dotnet_build, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                analyzer.analyze()
+            return dotnet_build.call_count
+
+        assert run_analysis() == 1
+        assert run_analysis() == 0
+
+        project_file.write_text('<Project Sdk="Microsoft.NET.Sdk"><PropertyGroup /></Project>\n')
+        assert run_analysis() == 1
+
+    def test_tool_dependency_files_match_configs_at_any_depth(self, temp_project_dir):
+        """Test that nested linter configs and lock files are tool dependencies."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['ruby', 'rust'], 'personal', use_cache=False)
+        project_files = [
+            os.path.join(str(temp_project_dir), *parts)
+            for parts in (('app.rb',), ('gems', 'core', '.rubocop.yml'), ('crates', 'cli', 'Cargo.lock'))
+        ]
+
+        with patch('src.analyzers.static_analyzer._which', return_value=None):
+            rubocop_files = analyzer._tool_dependency_files('rubocop', project_files)
+            clippy_files = analyzer._tool_dependency_files('clippy', project_files)
+
+        assert rubocop_files == [project_files[1]]
+        assert clippy_files == [project_files[2]]
+
+    def test_check_tool_installed_caches_path_lookup(self, temp_project_dir):
+        """Test that PATH is searched once per command and wrapper tools resolve."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['python', 'rust'], 'deployment', use_cache=False)
+        _which.cache_clear()
+        try:
+            with patch('src.analyzers.static_analyzer.shutil.which', return_value='/usr/bin/tool') as which:
+                assert analyzer._check_tool_installed('pylint')
+                assert analyzer._check_tool_installed('pylint')
+                # clippy은 cargo 명령으로 실행됨
+                assert analyzer._check_tool_installed('clippy')
+
+            assert [call.args[0] for call in which.call_args_list] == ['pylint', 'cargo']
+        finally:
+            _which.cache_clear()
+
+    def test_language_runners_skip_absent_languages(self, temp_project_dir):
+        """Test that language-specific runners do nothing for other languages."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'deployment', use_cache=False)
+
+        with patch('src.analyzers.static_analyzer.subprocess.Popen') as popen:
+            for runner in (analyzer._run_staticcheck, analyzer._run_clippy, analyzer._run_dotnet_build):
+                assert runner() == []
+
+        popen.assert_not_called()
+
+    def test_find_build_target_prefers_solution(self, temp_project_dir):
+        """Test that a .sln is preferred and build output directories are skipped."""
+        (temp_project_dir / 'obj').mkdir()
+        (temp_project_dir / 'obj' / 'Stale.sln').write_text('')
+        (temp_project_dir / 'App.csproj').write_text('')
+
+        analyzer = StaticAnalyzer(temp_project_dir, ['csharp'], 'deployment', use_cache=False)
+        assert analyzer._find_build_target() == temp_project_dir / 'App.csproj'
+
+        (temp_project_dir / 'src').mkdir()
+        (temp_project_dir / 'src' / 'App.sln').write_text('')
+        assert analyzer._find_build_target() == temp_project_dir / 'src' / 'App.sln'
+
+    @pytest.mark.skipif(os.name != 'posix', reason="process groups are POSIX-only")
+    def test_run_tool_timeout_kills_child_processes(self):
+        """Test that a timeout also stops processes spawned by the tool."""
+        start = time.monotonic()
+
+        # 손자 프로세스가 남으면 출력 파이프가 닫히지 않아 communicate()가 10초간 대기
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_tool(['sh', '-c', 'sleep 10 & wait'], timeout=0.5)
+
+        assert time.monotonic() - start < 5
+
+    @pytest.mark.skipif(os.name != 'posix', reason="process groups are POSIX-only")
+    def test_run_tool_interrupt_kills_process_group(self):
+        """Test that Ctrl+C while waiting on a tool kills its process group."""
+        started = {}
+
+        def interrupt(proc, timeout=None):
+            started['pid'] = proc.pid
+            raise KeyboardInterrupt
+
+        with patch.object(subprocess.Popen, 'communicate', interrupt), pytest.raises(KeyboardInterrupt):
+            _run_tool(['sh', '-c', 'sleep 10 & wait'], timeout=30)
+
+        # 도구는 새 세션(프로세스 그룹 ID = 도구 PID)에서 실행되므로 그룹이 남아 있으면 신호 전송이 성공
+        with pytest.raises(ProcessLookupError):
+            os.killpg(started['pid'], 0)
+
+    @pytest.mark.skipif(os.name != 'posix', reason="process groups are POSIX-only")
+    def test_run_tools_interrupt_stops_queued_tool_runs(self, temp_project_dir):
+        """Test that Ctrl+C also stops tool runs a worker would start afterwards."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=False)
+
+        def run_batches():
+            # rubocop 배치처럼 한 작업 스레드가 도구를 차례로 실행
+            for _ in range(3):
+                _run_tool(['sleep', '3'], timeout=30)
+            return []
+
+        timer = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGINT))
+        start = time.monotonic()
+        timer.start()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                analyzer._run_tools([('a', None, run_batches), ('b', None, run_batches)], None)
+        finally:
+            timer.cancel()
+
+        assert time.monotonic() - start < 2
+
+    def test_split_by_size_balances_bytes_and_caps_files(self, temp_project_dir):
+        """Test that shards have similar total sizes and bounded file counts."""
+        (temp_project_dir / 'big.py').write_text('x' * 1000)
+        for index in range(PYLINT_MAX_FILES_PER_RUN + 10):
+            (temp_project_dir / f'small{index}.py').write_text('x')
+        paths = sorted(path.name for path in temp_project_dir.iterdir())
+
+        shards = _split_by_size(paths, temp_project_dir, 2)
+
+        assert sorted(path for shard in shards for path in shard) == paths
+        assert all(len(shard) <= PYLINT_MAX_FILES_PER_RUN for shard in shards)
+        # 큰 파일이 든 묶음에는 작은 파일이 적게 배치됨
+        big_shard = next(shard for shard in shards if 'big.py' in shard)
+        assert len(big_shard) < len(paths) // 2
+
+    def test_run_pylint_reports_failed_shard_files(self, temp_project_dir):
+        """Test that a failed shard names its files and other shards keep their issues."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=False)
+        timed_out = {'tool': 'pylint', 'severity': 'warning', 'message': 'timed out'}
+
+        def run_shard(shard):
+            if 'b.py' in shard:
+                return [timed_out]
+            return [{'tool': 'pylint', 'file': path, 'message': path} for path in shard]
+
+        with patch('src.analyzers.static_analyzer.PYLINT_JOBS', 2), \
+                patch('src.analyzers.static_analyzer._split_by_size', return_value=[['a.py'], ['b.py']]), \
+                patch.object(analyzer, '_check_tool_installed', return_value=True), \
+                patch.object(analyzer, '_run_pylint_shard', side_effect=run_shard):
+            issues = analyzer._run_pylint(['a.py', 'b.py'])
+
+        assert issues == [
+            {'tool': 'pylint', 'file': 'a.py', 'message': 'a.py'},
+            {**timed_out, 'failed_files': ['b.py']},
+        ]
+
+    def test_collect_project_files_skips_dependency_dirs(self, temp_project_dir):
+        """Test that dependency and cache directories are skipped but source packages are not."""
+        for name in ('node_modules', 'venv', 'pkg.egg-info', 'src', 'src/build'):
+            (temp_project_dir / name).mkdir()
+            (temp_project_dir / name / 'mod.py').write_text('x = 1\n')
+        (temp_project_dir / 'main.py').write_text('x = 1\n')
+        (temp_project_dir / 'src' / 'mod.pyc').write_bytes(b'')
+
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=True)
+        analyzer.cache_manager.save_result('key', {})
+        files = analyzer._collect_project_files()
+
+        assert all(isinstance(f, str) for f in files)
+        assert sorted(Path(f).relative_to(temp_project_dir).as_posix() for f in files) == [
+            'main.py', 'src/build/mod.py', 'src/mod.py'
+        ]
+
+    def test_run_semgrep_pinned_config_disables_metrics(self, temp_project_dir):
+        """Test that a pinned semgrep ruleset is used without metrics."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'deployment', use_cache=False)
+        completed = subprocess.CompletedProcess([], 0, b'{"results": []}', b'')
+
+        with patch('src.analyzers.static_analyzer.SEMGREP_CONFIG', 'rules.yml'), \
+                patch.object(analyzer, '_check_tool_installed', return_value=True), \
+                patch('src.analyzers.static_analyzer._run_tool', return_value=completed) as run_tool:
+            assert analyzer._run_semgrep() == []
+
+        args = run_tool.call_args.args[0]
+        assert '--config=rules.yml' in args
+        assert '--metrics=off' in args
+
+    def test_run_dotnet_build_parses_msbuild_diagnostics(self, temp_project_dir):
+        """Test that MSBuild warnings and errors are parsed with file and line."""
+        (temp_project_dir / 'App.csproj').write_text('')
+        output = (
+            b"C:\\src\\Program.cs(10,5): warning CS0219: Variable 'x' is unused [C:\\src\\App.csproj]\n"
+            b"Build started.\n"
+        )
+        completed = subprocess.CompletedProcess([], 1, output, b'CSC : error CS2001: Source file missing\n')
+
+        analyzer = StaticAnalyzer(temp_project_dir, ['csharp'], 'deployment', use_cache=False)
+        with patch.object(analyzer, '_check_tool_installed', return_value=True), \
+                patch('src.analyzers.static_analyzer._run_tool', return_value=completed):
+            issues = analyzer._run_dotnet_build()
+
+        assert [(i['file'], i['line'], i['code'], i['severity']) for i in issues] == [
+            ('C:\\src\\Program.cs', 10, 'CS0219', 'warning'),
+            ('unknown', 0, 'CS2001', 'critical'),
+        ]
+        assert issues[0]['message'] == "Variable 'x' is unused [C:\\src\\App.csproj]"
+
+    def test_get_file_hashes_reads_each_file_once(self, temp_project_dir):
+        """Test that file hashes are computed once and shared between tools."""
+        (temp_project_dir / 'a.py').write_text('x = 1\n')
+        (temp_project_dir / 'b.py').write_text('y = 2\n')
+        files = [str(temp_project_dir / 'b.py'), str(temp_project_dir / 'a.py')]
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=False)
+
+        first = analyzer._get_file_hashes(files)
+        with patch('builtins.open') as open_file:
+            second = analyzer._get_file_hashes(files[:1])
+
+        open_file.assert_not_called()
+        assert list(first) == ['a.py', 'b.py']
+        assert second == {'b.py': first['b.py']}
+
+    def test_analyze_reruns_all_files_when_tool_config_changes(self, temp_project_dir):
+        """Test that editing a tool config file invalidates its cached per-file results."""
+        (temp_project_dir / 'a.rb').write_text('x = 1\n')
+        (temp_project_dir / '.rubocop.yml').write_text('AllCops: {}\n')
+
+        def run_analysis():
+            analyzer = StaticAnalyzer(temp_project_dir, ['ruby'], 'personal', use_cache=True)
+            with patch.object(analyzer, '_run_rubocop', return_value=[]) as rubocop, \
+                    patch.object(analyzer, '_run_jscpd', return_value=[]):
+                analyzer.analyze()
+            return rubocop
+
+        run_analysis()
+        assert run_analysis().call_count == 0
+
+        (temp_project_dir / '.rubocop.yml').write_text('AllCops:\n  NewCops: enable\n')
+        run_analysis().assert_called_once_with(['a.rb'])
+
+    def test_run_pylint_whole_project_uses_parallel_jobs(self, temp_project_dir):
+        """Test that an unsharded pylint run uses pylint's own worker processes."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['python'], 'personal', use_cache=False)
+        completed = subprocess.CompletedProcess([], 0, b'[]', b'')
+
+        with patch('src.analyzers.static_analyzer.PYLINT_JOBS', 4), \
+                patch.object(analyzer, '_check_tool_installed', return_value=True), \
+                patch('src.analyzers.static_analyzer._run_tool', return_value=completed) as run_tool:
+            assert analyzer._run_pylint() == []
+            assert analyzer._run_pylint(['a.py']) == []
+
+        assert '--jobs=4' in run_tool.call_args_list[0].args[0]
+        assert '--jobs=1' in run_tool.call_args_list[1].args[0]
+
+    def test_run_rubocop_passes_explicit_files_in_batches(self, temp_project_dir):
+        """Test that RuboCop receives the given files instead of walking the project."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['ruby'], 'personal', use_cache=False)
+        output = b'{"files": [{"path": "a.rb", "offenses": [{"severity": "convention", "message": "m"}]}]}'
+        completed = subprocess.CompletedProcess([], 1, output, b'')
+
+        with patch('src.analyzers.static_analyzer.RUBOCOP_MAX_FILES_PER_RUN', 2), \
+                patch.object(analyzer, '_check_tool_installed', return_value=True), \
+                patch('src.analyzers.static_analyzer._run_tool', return_value=completed) as run_tool:
+            issues = analyzer._run_rubocop(['a.rb', 'b.rb', 'c.rb'])
+
+        batches = [call.args[0][-2:] for call in run_tool.call_args_list]
+        assert batches == [['a.rb', 'b.rb'], ['--force-exclusion', 'c.rb']]
+        assert [issue['file'] for issue in issues] == ['a.rb', 'a.rb']
+
+    def test_run_rubocop_reports_unparsable_output_as_failure(self, temp_project_dir):
+        """Test that broken RuboCop output marks its files as failed instead of clean."""
+        analyzer = StaticAnalyzer(temp_project_dir, ['ruby'], 'personal', use_cache=False)
+        completed = subprocess.CompletedProcess([], 2, b'', b'invalid configuration')
+
+        with patch.object(analyzer, '_check_tool_installed', return_value=True), \
+                patch('src.analyzers.static_analyzer._run_tool', return_value=completed):
+            issues = analyzer._run_rubocop(['a.rb'])
+
+        assert issues == [{
+            'tool': 'rubocop',
+            'severity': 'warning',
+            'message': 'RuboCop output parsing failed',
+            'failed_files': ['a.rb']
+        }]